@@ -3,15 +3,332 @@ try:
 except ImportError:
     import pyautogen as autogen
 
+# trafilatura extracts article bodies with lxml-backed boilerplate removal;
+# fall back to the BeautifulSoup path when it isn't installed
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
+# fastfeedparser parses feeds with lxml instead of feedparser's pure-Python
+# SAX machinery (an order of magnitude faster); optional like trafilatura
+try:
+    import fastfeedparser
+except ImportError:
+    fastfeedparser = None
+
+# scikit-learn enables semantic headline grouping (TF-IDF + agglomerative
+# clustering); without it dedup falls back to the MinHash path
+try:
+    from sklearn.cluster import AgglomerativeClustering
+    from sklearn.feature_extraction.text import TfidfVectorizer
+except ImportError:
+    TfidfVectorizer = None
+
 from typing import List, Dict, Any
+import asyncio
+import difflib
+import concurrent.futures
+import functools
 import json
+import aiohttp
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 from datetime import datetime
 import os
+import time
+import zlib
+import article_cache
 from config import Config
+from prompts import AGENT_SPECS
+
+# Only advertise brotli when a decoder is actually installed, otherwise a
+# br-encoded response can't be decompressed
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Shared HTTP session so feed and article fetches reuse pooled connections
+# instead of paying a TCP/TLS handshake per request
+_session = requests.Session()
+_session.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; DiderotAI/1.0)",
+    "Accept-Encoding": _ACCEPT_ENCODING
+})
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=requests.adapters.Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504]
+    )
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Skip non-content tags at parse time instead of decomposing them afterwards.
+# attrs defaults to None because bs4 4.13+ calls name filters with only the
+# tag name, while older versions pass (name, attrs)
+_CONTENT_STRAINER = SoupStrainer(
+    lambda name, attrs=None: name not in ('script', 'style', 'noscript', 'svg')
+)
+_WS_RE = re.compile(r'\s+')
+# Maps every ASCII whitespace character to a plain space in one C-level pass,
+# which keeps the regex below from matching across exotic whitespace on big pages
+_WS_TABLE = str.maketrans({c: ' ' for c in '\t\n\r\x0b\x0c'})
+
+# Shared pool for feed fetches, created once instead of per call so the
+# 10-headline loop reuses warm threads rather than spawning ~9 per headline
+_FEED_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=16)
+
+# Conditional-GET state per feed URL: validators plus the last body, so
+# unchanged feeds cost a 304 with no payload instead of a full download
+_feed_http_cache = {}
+
+def _conditional_get(url, timeout=10):
+    """GET a feed URL, revalidating with ETag/If-Modified-Since when known
+
+    Returns the response body, served from the in-process cache when the
+    server answers 304 Not Modified.
+    """
+    cached = _feed_http_cache.get(url)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = _session.get(url, timeout=timeout, headers=headers or None)
+    if response.status_code == 304 and cached:
+        return cached["content"]
+    response.raise_for_status()
+
+    _feed_http_cache[url] = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content": response.content
+    }
+    return response.content
+
+async def _aconditional_get(session, url, timeout=10):
+    """Async twin of _conditional_get sharing the same validator cache"""
+    cached = _feed_http_cache.get(url)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    async with session.get(
+        url, timeout=aiohttp.ClientTimeout(total=timeout), headers=headers or None
+    ) as response:
+        if response.status == 304 and cached:
+            return cached["content"]
+        response.raise_for_status()
+        content = await response.read()
+
+        _feed_http_cache[url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content": content
+        }
+        return content
+
+@functools.lru_cache(maxsize=32)
+def _parse_feed(content):
+    """Parse feed bytes, preferring fastfeedparser when installed
+
+    Memoized on the raw content: a 304 revalidation hands back the same
+    bytes, so an unchanged feed costs a hash lookup instead of a reparse.
+    """
+    if fastfeedparser is not None:
+        try:
+            return fastfeedparser.parse(content)
+        except Exception:
+            pass  # fall back to feedparser's tolerant parser
+    return feedparser.parse(content)
+
+def _fetch_feed(url, timeout=10):
+    """Fetch a feed URL through the shared session and parse it"""
+    return _parse_feed(_conditional_get(url, timeout))
+
+def _entry_field(entry, name, default=""):
+    """Read a feed entry field from dict-style or attribute-style entries"""
+    try:
+        return entry.get(name, default)
+    except AttributeError:
+        return getattr(entry, name, default)
+
+def _strip_html(text):
+    """Drop inline HTML from a feed summary before it reaches any prompt
+
+    RSS summaries routinely embed anchors and tracking markup that inflate
+    prompt tokens without adding information. Plain-text summaries skip the
+    parse entirely.
+    """
+    if not text or '<' not in text:
+        return text
+    try:
+        return _WS_RE.sub(' ', BeautifulSoup(text, 'html.parser').get_text(' ')).strip()
+    except Exception:
+        return text
+
+def _parse_rss_items(content, limit=10):
+    """Parse RSS <item> entries directly with lxml
+
+    feedparser handles every feed dialect in pure Python; the Google News
+    feeds are plain RSS 2.0 and we only read four fields, so a direct lxml
+    parse avoids that overhead. Raises on malformed XML so callers can fall
+    back to feedparser's tolerant parser.
+    """
+    tree = etree.fromstring(content)
+    return [
+        {
+            "title": item.findtext('title') or "",
+            "link": item.findtext('link') or "",
+            "published": item.findtext('pubDate') or "",
+            "source": item.findtext('source') or "Unknown"
+        }
+        for item in tree.xpath('//item')[:limit]
+    ]
+
+@functools.lru_cache(maxsize=8)
+def _parse_rss_items_cached(content, limit=10):
+    """Tuple-returning memo of _parse_rss_items, keyed on the feed bytes"""
+    return tuple(_parse_rss_items(content, limit))
+
+# MinHash dedup parameters: 64 hash permutations over 5-character title shingles
+_MINHASH_PERMS = 64
+_MINHASH_THRESHOLD = 0.7
+# LSH banding: 16 bands of 4 rows each — pairs above the similarity
+# threshold almost surely collide in at least one band
+_MINHASH_BANDS = 16
+
+# Title normalization for shingling: one C-level translate call strips
+# punctuation, and common filler words are dropped so rewordings like
+# "Biden's climate bill" vs "the Biden climate bill" still collide
+_PUNCT_TABLE = str.maketrans("", "", ".,!?\"'’“”()[]:;")
+_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "but", "or", "of", "to", "in", "on", "for",
+    "with", "as", "at", "by", "is", "are", "was", "were", "be", "been",
+    "after", "amid", "over", "about", "their", "there", "this", "that",
+    "which", "where", "would", "could", "will", "has", "have", "says"
+})
+
+def _stem(word):
+    """Tiny inline stemmer: fold plurals/possessives so 'elections' ~ 'election'"""
+    if len(word) > 4 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+def _title_shingles(title):
+    """Shingle a normalized title into 5-character n-grams for near-duplicate detection"""
+    words = title.lower().translate(_PUNCT_TABLE).split()
+    normalized = ' '.join(_stem(w) for w in words if w not in _STOPWORDS)
+    if len(normalized) < 5:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + 5] for i in range(len(normalized) - 4)}
+
+def _minhash_signature(shingles):
+    """Compute a MinHash signature using seeded CRC32 as the hash family"""
+    encoded = [s.encode('utf-8') for s in shingles]
+    return [min(zlib.crc32(s, seed) for s in encoded) for seed in range(_MINHASH_PERMS)]
+
+def _estimated_jaccard(sig_a, sig_b):
+    """Estimate Jaccard similarity from two MinHash signatures"""
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / _MINHASH_PERMS
+
+def dedupe_headlines(headlines):
+    """Collapse near-duplicate headlines before any expensive analysis
+
+    Cross-category RSS fetches surface the same story under slightly different
+    titles; every duplicate that slips through costs a full round of article
+    fetches and LLM calls downstream. The first entry seen (feeds are ordered
+    by prominence) is kept as the canonical one per cluster.
+
+    When scikit-learn is installed, titles are grouped semantically with
+    TF-IDF + agglomerative clustering, which also catches stories that share
+    a topic but little vocabulary; otherwise the MinHash path applies.
+    """
+    if TfidfVectorizer is not None and len(headlines) > 1:
+        try:
+            return _dedupe_semantic(headlines)
+        except Exception as e:
+            print(f"Error in semantic dedup, using MinHash fallback: {e}")
+    return _dedupe_minhash(headlines)
+
+def _dedupe_semantic(headlines):
+    """Keep the first headline of each TF-IDF cosine-similarity cluster
+
+    The distance threshold is deliberately tight (average similarity ≥ 0.65)
+    because clusters here feed dedup: merging merely same-topic stories would
+    drop distinct headlines from the report.
+    """
+    titles = [h.get('title', '') for h in headlines]
+    vectors = TfidfVectorizer(stop_words='english').fit_transform(titles)
+    labels = AgglomerativeClustering(
+        n_clusters=None,
+        distance_threshold=0.35,
+        metric='cosine',
+        linkage='average'
+    ).fit_predict(vectors.toarray())
+
+    kept = {}
+    for label, headline in zip(labels, headlines):
+        kept.setdefault(label, headline)
+    return list(kept.values())
+
+def _dedupe_minhash(headlines):
+    """MinHash/LSH near-duplicate pass used when scikit-learn is absent
+
+    Kept signatures are indexed by LSH bands, so each new headline is
+    verified only against the few candidates sharing a band bucket rather
+    than every kept headline (single pass instead of a quadratic scan).
+    """
+    kept = []
+    buckets = {}
+    rows = _MINHASH_PERMS // _MINHASH_BANDS
+    for headline in headlines:
+        shingles = _title_shingles(headline.get('title', ''))
+        if not shingles:
+            continue
+
+        signature = _minhash_signature(shingles)
+        band_keys = [
+            (band, tuple(signature[band * rows:(band + 1) * rows]))
+            for band in range(_MINHASH_BANDS)
+        ]
+        candidates = {i for key in band_keys for i in buckets.get(key, ())}
+        is_duplicate = any(
+            _estimated_jaccard(signature, kept[i][0]) >= _MINHASH_THRESHOLD
+            for i in candidates
+        )
+        if not is_duplicate:
+            index = len(kept)
+            kept.append((signature, headline))
+            for key in band_keys:
+                buckets.setdefault(key, []).append(index)
+
+    return [headline for _, headline in kept]
+
+# Completion detection for agent replies: an explicit TERMINATE token, a JSON
+# status field, or a closing code fence all count as done. Agents regularly
+# forget the literal TERMINATE, and every miss used to cost a wasted round-trip.
+_TERM_RE = re.compile(r'(?:TERMINATE|"status"\s*:\s*"done"|```\s*$)', re.M)
+
+def _is_termination_msg(message):
+    """Detect completed agent turns, including tool-call responses"""
+    if message.get("function_call") or message.get("tool_calls"):
+        return True
+    return bool(_TERM_RE.search(message.get("content") or ""))
 
 # Get LLM configuration from config
 llm_config = Config.get_llm_config()
@@ -24,186 +341,23 @@ class NewsAgents:
     
     def setup_agents(self):
         """Initialize all agents with their specific roles and configurations"""
-        
-        # HeadlineFinderAgent - Finds top trending headlines
-        self.headline_finder = autogen.AssistantAgent(
-            name="HeadlineFinderAgent",
-            system_message="""You are a specialized news headline finder. Your task is to:
-1. Fetch the top 3 trending headlines in either US or World Politics 
-2. Categorize each headline as 'US', 'World'
-3. Return results in JSON format: [{"title": "...", "category": "world|politics|other"}]
-
-Use RSS feeds from Google News for different categories:
-- World: https://news.google.com/rss/sections/topic/WORLD
-- Politics: https://news.google.com/rss/sections/topic/POLITICS
-- Top Stories: https://news.google.com/rss
-
-Ensure headlines are current and significant. Avoid entertainment, sports, and local news unless they have major political/world implications.""",
-            llm_config=llm_config
-        )
-        
-        # ArticleFinderAgent - Finds articles from different political perspectives
-        self.article_finder = autogen.AssistantAgent(
-            name="ArticleFinderAgent",
-            system_message="""You are a specialized article finder that gathers news from across the political spectrum. For each headline, find 1-2 relevant articles from each perspective:
-
-LEFT PERSPECTIVE:
-- CNN (https://www.cnn.com/services/rss/)
-- New York Times (https://rss.nytimes.com/services/xml/rss/)
-
-CENTER PERSPECTIVE:
-- Reuters (https://feeds.reuters.com/Reuters/worldNews)
-- Associated Press (https://feeds.ap.org/ap/english)
 
-RIGHT PERSPECTIVE:
-- Fox News (https://feeds.foxnews.com/foxnews/latest)
-- New York Post (https://nypost.com/feed/)
-
-Return results in JSON format:
-[{"source": "CNN", "title": "...", "url": "...", "perspective": "left"}, ...]
-
-Focus on articles that directly address the headline topic. Ensure diversity of perspectives.""",
-            llm_config=llm_config
-        )
-        
-        # ResearchCompilerAgent - Compiles research from all articles
-        self.research_compiler = autogen.AssistantAgent(
-            name="ResearchCompilerAgent",
-            system_message="""You are a research compiler that analyzes articles to extract facts and opinions. For each article:
-
-1. Extract VERIFIABLE FACTS (dates, numbers, quotes, events)
-2. Identify OPINIONS/INTERPRETATIONS (editorial content, analysis, commentary)
-3. Note the source's perspective and potential bias
-4. Cross-reference facts across sources
-
-Return results in JSON format:
-{
-  "CNN": {"facts": ["fact1", "fact2"], "opinions": ["opinion1", "opinion2"]},
-  "Fox News": {"facts": ["fact1", "fact2"], "opinions": ["opinion1", "opinion2"]},
-  ...
-}
-
-Be objective and thorough. Distinguish clearly between facts and interpretations.""",
-            llm_config=llm_config
-        )
-        
-        # DeterminatorAgent - Identifies solid truths and perspectives
-        self.determinator = autogen.AssistantAgent(
-            name="DeterminatorAgent",
-            system_message="""You are a determinator that identifies solid truths and maps perspectives. Your tasks:
-
-1. Identify FACTS that are consistent across multiple sources
-2. Map each source to its political perspective (Left/Right/Center)
-3. Identify the justification/rationale behind each perspective
-4. Note any inconsistencies or contradictions
-
-Return results in JSON format:
-{
-  "solid_facts": ["fact1", "fact2"],
-  "perspectives": {
-    "left": {"sources": ["CNN", "NYT"], "justification": "..."},
-    "right": {"sources": ["Fox", "NYPost"], "justification": "..."},
-    "center": {"sources": ["Reuters", "AP"], "justification": "..."}
-  }
-}
-
-Be analytical and objective. Focus on policy positions and ideological differences.""",
-            llm_config=llm_config
-        )
-        
-        # FlawsAgent - Identifies potential flaws in each perspective
-        self.flaws_agent = autogen.AssistantAgent(
-            name="FlawsAgent",
-            system_message="""You are a flaws analyst that identifies potential issues with each perspective. For each perspective:
-
-1. Identify potential logical fallacies
-2. Note missing context or counterarguments
-3. Point out potential bias or selective reporting
-4. Suggest what information might be missing with concrete facts 
-
-Return results in JSON format:
-{
-  "left_perspective": {"flaws": ["flaw1", "flaw2"], "missing_context": "..."},
-  "right_perspective": {"flaws": ["flaw1", "flaw2"], "missing_context": "..."},
-  "center_perspective": {"flaws": ["flaw1", "flaw2"], "missing_context": "..."}
-}
-
-Be constructive and analytical. Focus on helping readers understand limitations.""",
-            llm_config=llm_config
-        )
-        
-        # BirdsEyeAgent - Consolidates all perspectives
-        self.birds_eye = autogen.AssistantAgent(
-            name="BirdsEyeAgent",
-            system_message="""You are a birds-eye analyst that consolidates all perspectives into a comprehensive view. Your tasks:
-
-1. Name perspectives based on actual ideological/policy stances (not generic labels)
-2. Order perspectives from Left → Center → Right when political
-3. Synthesize justifications and identify flaws
-4. Create a balanced overview
-
-Return results in JSON format:
-{
-  "perspectives": [
-    {
-      "name": "Progressive Reform Perspective",
-      "justification": "...",
-      "flaws": ["..."],
-      "position": "left"
-    },
-    {
-      "name": "Centrist Pragmatic Perspective", 
-      "justification": "...",
-      "flaws": ["..."],
-      "position": "center"
-    },
-    {
-      "name": "Conservative Traditional Perspective",
-      "justification": "...", 
-      "flaws": ["..."],
-      "position": "right"
-    }
-  ]
-}
-
-Use specific, descriptive names that reflect actual policy positions.""",
-            llm_config=llm_config
-        )
-        
-        # JournalistAgent - Generates final report
-        self.journalist = autogen.AssistantAgent(
-            name="JournalistAgent",
-            system_message="""You are a professional journalist that creates the final news report. For each headline, create:
-
-1. FACTUAL HEADLINE (neutral, accurate)
-2. SOURCE LINKS (all articles used)
-3. NEUTRAL SUMMARY (objective facts only)
-4. MULTI-PERSPECTIVE ANALYSIS (if political/world issue)
-
-Return results in JSON format:
-{
-  "title": "Factual Headline",
-  "sources": [{"source": "CNN", "title": "...", "url": "..."}],
-  "neutral_summary": "...",
-  "perspectives": [
-    {
-      "name": "Perspective Name",
-      "justification": "...",
-      "flaws": ["..."]
-    }
-  ]
-}
+        # Assistant agents are declared in prompts.AGENT_SPECS; each spec
+        # becomes an attribute (e.g. self.headline_finder)
+        for attr_name, agent_name, system_message in AGENT_SPECS:
+            setattr(self, attr_name, autogen.AssistantAgent(
+                name=agent_name,
+                system_message=system_message,
+                llm_config=Config.get_llm_config_for_agent(agent_name)
+            ))
 
-Write in clear, professional journalistic style. Be objective and balanced.""",
-            llm_config=llm_config
-        )
-        
-        # User proxy for orchestrating the workflow
+        # User proxy for orchestrating the workflow; the tight auto-reply
+        # bound keeps a forgotten TERMINATE token from burning LLM calls
         self.user_proxy = autogen.UserProxyAgent(
             name="UserProxy",
             human_input_mode="NEVER",
-            max_consecutive_auto_reply=10,
-            is_termination_msg=lambda x: x.get("content", "").rstrip().endswith("TERMINATE"),
+            max_consecutive_auto_reply=2,
+            is_termination_msg=_is_termination_msg,
             code_execution_config={"work_dir": "workspace"},
             llm_config=llm_config
         )
@@ -211,39 +365,255 @@ Write in clear, professional journalistic style. Be objective and balanced.""",
 class NewsDataFetcher:
     """Handles actual data fetching from RSS feeds and news sources"""
     
-    @staticmethod
-    def fetch_google_news_rss(category="top"):
+    RSS_URLS = {
+        "top": "https://news.google.com/rss",
+        "world": "https://news.google.com/rss/sections/topic/WORLD",
+        "politics": "https://news.google.com/rss/sections/topic/POLITICS"
+    }
+
+    @classmethod
+    def fetch_google_news_rss(cls, category="top"):
         """Fetch headlines from Google News RSS"""
-        rss_urls = {
-            "top": "https://news.google.com/rss",
-            "world": "https://news.google.com/rss/sections/topic/WORLD",
-            "politics": "https://news.google.com/rss/sections/topic/POLITICS"
+        url = cls.RSS_URLS.get(category, cls.RSS_URLS["top"])
+        try:
+            content = _conditional_get(url, timeout=10)
+
+            try:
+                # Copies keep callers free to mutate without poisoning the memo
+                return [dict(item) for item in _parse_rss_items_cached(content)]
+            except etree.XMLSyntaxError:
+                # Malformed XML: fall back to feedparser's tolerant parser
+                feed = feedparser.parse(content)
+                return [
+                    {
+                        "title": entry.title,
+                        "link": entry.link,
+                        "published": entry.get("published", ""),
+                        "source": entry.get("source", {}).get("title", "Unknown")
+                    }
+                    for entry in feed.entries[:10]
+                ]
+        except Exception as e:
+            print(f"Error fetching RSS: {e}")
+            return []
+
+    @classmethod
+    def fetch_all_categories(cls):
+        """Fetch headlines for all RSS categories concurrently"""
+        headlines_by_category = {}
+        futures = {
+            _FEED_EXECUTOR.submit(cls.fetch_google_news_rss, category): category
+            for category in cls.RSS_URLS
+        }
+        for future in concurrent.futures.as_completed(futures):
+            category = futures[future]
+            try:
+                headlines_by_category[category] = future.result()
+            except Exception as e:
+                print(f"Error fetching RSS for {category}: {e}")
+                headlines_by_category[category] = []
+
+        return headlines_by_category
+
+    # Per-source feed parses are cached so the 10-headline loop fetches each
+    # feed at most once instead of once per headline
+    _source_feed_cache = {}
+    _SOURCE_FEED_TTL = 900  # seconds
+
+    # Minimum title similarity for an entry to count as covering a headline
+    _MATCH_THRESHOLD = 0.4
+
+    @classmethod
+    def fetch_articles_for_headline(cls, headline, max_articles=6):
+        """Fetch real articles covering a headline from the configured sources
+
+        Prefers NewsAPI when a key is configured; otherwise fetches each
+        perspective's RSS feeds concurrently and matches entries to the
+        headline by title similarity. Falls back to simulated articles only
+        when nothing real could be retrieved.
+        """
+        if Config.NEWS_API_KEY:
+            articles = cls._fetch_articles_from_newsapi(headline, max_articles)
+            if articles:
+                return articles
+
+        sources = [
+            (perspective, source)
+            for perspective, source_list in Config.NEWS_SOURCES.items()
+            for source in source_list
+        ]
+
+        articles = []
+        futures = {
+            _FEED_EXECUTOR.submit(cls._fetch_source_feed, source): (perspective, source)
+            for perspective, source in sources
         }
-        
-        url = rss_urls.get(category, rss_urls["top"])
+        for future in concurrent.futures.as_completed(futures):
+            perspective, source = futures[future]
+            try:
+                entries = future.result()
+            except Exception as e:
+                print(f"Error fetching feed for {source['name']}: {e}")
+                continue
+
+            entry = cls._best_match(headline, entries)
+            if entry:
+                articles.append({
+                    "source": source["name"],
+                    "title": entry["title"],
+                    "url": entry["link"],
+                    "perspective": perspective,
+                    "content": entry.get("summary", "")
+                })
+
+        if not articles:
+            return cls._simulated_articles(headline, max_articles)
+
+        return articles[:max_articles]
+
+    @classmethod
+    async def afetch_articles_for_headline(cls, headline, max_articles=6):
+        """Async twin of fetch_articles_for_headline using aiohttp
+
+        Downloads every source feed concurrently on one session without
+        blocking the event loop; parsing is offloaded to the default
+        executor.
+        """
+        if Config.NEWS_API_KEY:
+            loop = asyncio.get_running_loop()
+            articles = await loop.run_in_executor(
+                None, cls._fetch_articles_from_newsapi, headline, max_articles
+            )
+            if articles:
+                return articles
+
+        sources = [
+            (perspective, source)
+            for perspective, source_list in Config.NEWS_SOURCES.items()
+            for source in source_list
+        ]
+
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=4)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(_session.headers)
+        ) as session:
+            entries_per_source = await asyncio.gather(
+                *(cls._afetch_source_feed(session, source) for _, source in sources),
+                return_exceptions=True
+            )
+
+        articles = []
+        for (perspective, source), entries in zip(sources, entries_per_source):
+            if isinstance(entries, Exception):
+                print(f"Error fetching feed for {source['name']}: {entries}")
+                continue
+
+            entry = cls._best_match(headline, entries)
+            if entry:
+                articles.append({
+                    "source": source["name"],
+                    "title": entry["title"],
+                    "url": entry["link"],
+                    "perspective": perspective,
+                    "content": entry.get("summary", "")
+                })
+
+        if not articles:
+            return cls._simulated_articles(headline, max_articles)
+
+        return articles[:max_articles]
+
+    @classmethod
+    async def _afetch_source_feed(cls, session, source):
+        """Async fetch+parse of one source's RSS feed, sharing the sync cache"""
+        cached = cls._source_feed_cache.get(source["rss"])
+        if cached and time.time() - cached[0] < cls._SOURCE_FEED_TTL:
+            return cached[1]
+
+        content = await _aconditional_get(session, source["rss"])
+
+        loop = asyncio.get_running_loop()
+        feed = await loop.run_in_executor(None, _parse_feed, content)
+        entries = cls._feed_entries(feed)
+
+        cls._source_feed_cache[source["rss"]] = (time.time(), entries)
+        return entries
+
+    @staticmethod
+    def _feed_entries(feed):
+        """Normalize parsed feed entries to plain dicts"""
+        return [
+            {
+                "title": _entry_field(entry, "title"),
+                "link": _entry_field(entry, "link"),
+                "summary": _strip_html(_entry_field(entry, "summary"))
+            }
+            for entry in feed.entries[:25]
+        ]
+
+    @classmethod
+    def _fetch_source_feed(cls, source):
+        """Fetch and parse one source's RSS feed, cached for 15 minutes"""
+        cached = cls._source_feed_cache.get(source["rss"])
+        if cached and time.time() - cached[0] < cls._SOURCE_FEED_TTL:
+            return cached[1]
+
+        feed = _fetch_feed(source["rss"])
+        entries = cls._feed_entries(feed)
+
+        cls._source_feed_cache[source["rss"]] = (time.time(), entries)
+        return entries
+
+    @classmethod
+    def _best_match(cls, headline, entries):
+        """Pick the feed entry whose title best matches the headline"""
+        best_entry = None
+        best_ratio = cls._MATCH_THRESHOLD
+        headline_lower = headline.lower()
+
+        for entry in entries:
+            ratio = difflib.SequenceMatcher(None, headline_lower, entry["title"].lower()).ratio()
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best_entry = entry
+
+        return best_entry
+
+    @classmethod
+    def _fetch_articles_from_newsapi(cls, headline, max_articles):
+        """Query NewsAPI for articles about a headline (requires NEWS_API_KEY)"""
         try:
-            feed = feedparser.parse(url)
-            headlines = []
-            
-            for entry in feed.entries[:10]:  # Get top 10
-                headlines.append({
-                    "title": entry.title,
-                    "link": entry.link,
-                    "published": entry.get("published", ""),
-                    "source": entry.get("source", {}).get("title", "Unknown")
+            response = _session.get(
+                "https://newsapi.org/v2/everything",
+                params={
+                    "q": headline,
+                    "pageSize": max_articles,
+                    "sortBy": "relevancy",
+                    "apiKey": Config.NEWS_API_KEY
+                },
+                timeout=10
+            )
+            response.raise_for_status()
+
+            articles = []
+            for item in response.json().get("articles", [])[:max_articles]:
+                articles.append({
+                    "source": item.get("source", {}).get("name", "Unknown"),
+                    "title": item.get("title", ""),
+                    "url": item.get("url", ""),
+                    "perspective": "unknown",
+                    "content": _strip_html(item.get("description") or "")
                 })
-            
-            return headlines
+
+            return articles
         except Exception as e:
-            print(f"Error fetching RSS: {e}")
+            print(f"Error querying NewsAPI: {e}")
             return []
-    
+
     @staticmethod
-    def fetch_articles_for_headline(headline, max_articles=6):
-        """Fetch articles from different sources for a given headline"""
-        # This is a simplified version - in production, you'd use NewsAPI or similar
-        # For now, we'll simulate finding articles
-        
+    def _simulated_articles(headline, max_articles=6):
+        """Last-resort simulated articles when no real ones could be fetched"""
         sources = [
             {"name": "CNN", "perspective": "left", "base_url": "https://www.cnn.com"},
             {"name": "Fox News", "perspective": "right", "base_url": "https://www.foxnews.com"},
@@ -252,7 +622,7 @@ class NewsDataFetcher:
             {"name": "New York Times", "perspective": "left", "base_url": "https://www.nytimes.com"},
             {"name": "New York Post", "perspective": "right", "base_url": "https://nypost.com"}
         ]
-        
+
         articles = []
         for source in sources[:max_articles]:
             # Simulate finding a relevant article
@@ -263,33 +633,94 @@ class NewsDataFetcher:
                 "perspective": source["perspective"],
                 "content": f"This is a simulated article about {headline} from {source['name']} perspective."
             })
-        
+
         return articles
     
     @staticmethod
-    def extract_article_content(url):
+    def _clean_html(content):
+        """Parse raw HTML and return cleaned article text"""
+        soup = BeautifulSoup(content, 'lxml', parse_only=_CONTENT_STRAINER)
+
+        # Collapse whitespace in a single pass: translate newlines/tabs to
+        # spaces first (one C call), then squeeze runs with the compiled regex
+        text = soup.get_text(separator=' ').translate(_WS_TABLE)
+        text = _WS_RE.sub(' ', text).strip()
+
+        return text[:2000]  # Limit content length
+
+    @classmethod
+    def _extract_text(cls, content):
+        """Extract article text, preferring trafilatura's boilerplate removal"""
+        if trafilatura is not None:
+            try:
+                text = trafilatura.extract(
+                    content.decode("utf-8", errors="ignore"),
+                    include_comments=False,
+                    include_tables=False,
+                    no_fallback=True
+                )
+                if text:
+                    return _WS_RE.sub(' ', text).strip()[:2000]
+            except Exception as e:
+                print(f"trafilatura extraction failed, using BeautifulSoup: {e}")
+
+        return cls._clean_html(content)
+
+    @classmethod
+    def extract_article_content(cls, url):
         """Extract content from article URL (simplified)"""
+        cached = article_cache.get_fields(url)
+        if cached.get("extracted_content"):
+            return cached["extracted_content"]
+
         try:
-            response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text content
-            text = soup.get_text()
-            
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            
-            return text[:2000]  # Limit content length
+            response = _session.get(url, timeout=(3.0, 10.0))
+            text = cls._extract_text(response.content)
+            article_cache.update_fields(url, extracted_content=text)
+            return text
         except Exception as e:
             print(f"Error extracting content from {url}: {e}")
             return "Content extraction failed"
 
+    @classmethod
+    async def aextract_article_content(cls, session, url):
+        """Async variant of extract_article_content using a shared aiohttp session"""
+        cached = article_cache.get_fields(url)
+        if cached.get("extracted_content"):
+            return cached["extracted_content"]
+
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                body = await response.read()
+
+            # Run the HTML parse in a worker thread so it doesn't block the event loop
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(None, cls._extract_text, body)
+            article_cache.update_fields(url, extracted_content=text)
+            return text
+        except Exception as e:
+            print(f"Error extracting content from {url}: {e}")
+            return "Content extraction failed"
+
+    @classmethod
+    async def extract_many(cls, urls):
+        """Extract content from many URLs concurrently"""
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=4)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *[cls.aextract_article_content(session, url) for url in urls],
+                return_exceptions=True
+            )
+
+    @classmethod
+    def extract_article_content_batch(cls, urls):
+        """Sync bridge for extract_many"""
+        results = asyncio.run(cls.extract_many(urls))
+        return [
+            result if isinstance(result, str) else "Content extraction failed"
+            for result in results
+        ]
+
 # Initialize the agents
 news_agents = NewsAgents()
 data_fetcher = NewsDataFetcher() 
\ No newline at end of file
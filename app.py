@@ -3,7 +3,7 @@ import json
 import os
 from datetime import datetime, date
 from simple_pipeline import SimpleNewsAnalysisPipeline
-import time
+import article_cache
 
 # Page configuration
 st.set_page_config(
@@ -60,8 +60,13 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_data(ttl=600, show_spinner=False)
 def load_cached_report(date_str):
-    """Load cached report for a specific date"""
+    """Load cached report for a specific date
+
+    Memoized across Streamlit reruns so widget interactions don't re-read
+    and re-parse the report JSON; save_report clears it after writing.
+    """
     cache_file = f"daily_reports/{date_str}.json"
     if os.path.exists(cache_file):
         with open(cache_file, 'r', encoding='utf-8') as f:
@@ -74,52 +79,82 @@ def save_report(date_str, report_data):
     cache_file = f"daily_reports/{date_str}.json"
     with open(cache_file, 'w', encoding='utf-8') as f:
         json.dump(report_data, f, indent=2, ensure_ascii=False)
+    # Drop the memoized copy so the next rerun sees the fresh report
+    load_cached_report.clear()
+
+# Precomputed templates and style map so the display loop does dict lookups
+# and .format calls instead of rebuilding f-strings and branches per render
+_HEADLINE_TEMPLATE = """
+<div class="headline-card">
+    <h2>{index}. {title}</h2>
+</div>
+"""
+
+_PERSPECTIVE_TEMPLATE = """
+<div class="perspective-card {cls}">
+    <h4>🎯 {name}</h4>
+    <p><strong>Justification:</strong> {justification}</p>
+</div>
+"""
+
+_PERSPECTIVE_CLASSES = {
+    "left": "left-perspective",
+    "right": "right-perspective",
+    "center": "center-perspective"
+}
+
+def _perspective_class(name):
+    """Map a perspective name to its CSS class"""
+    lowered = name.lower()
+    for key, cls in _PERSPECTIVE_CLASSES.items():
+        if key in lowered:
+            return cls
+    return ""
 
 def display_headline(headline_data, index):
     """Display a single headline with all its components"""
     with st.container():
-        st.markdown(f"""
-        <div class="headline-card">
-            <h2>{index + 1}. {headline_data['title']}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
+        st.markdown(
+            _HEADLINE_TEMPLATE.format(index=index + 1, title=headline_data['title']),
+            unsafe_allow_html=True
+        )
+
         # Source Articles
         if headline_data.get('sources'):
             st.subheader("📰 Source Articles")
-            for source in headline_data['sources']:
-                st.markdown(f"- [{source['title']}]({source['url']}) ({source['source']})")
-        
+            st.markdown("\n".join(
+                f"- [{source['title']}]({source['url']}) ({source['source']})"
+                for source in headline_data['sources']
+            ))
+
         # Neutral Summary
         if headline_data.get('neutral_summary'):
             st.subheader("📋 Neutral Factual Summary")
             st.write(headline_data['neutral_summary'])
-        
+
         # Perspectives (only for world/political issues)
         if headline_data.get('perspectives') and headline_data['category'] in ['world', 'politics']:
             st.subheader("🔍 Multi-Perspective Analysis")
-            
+
+            # Render all perspective cards in one markdown call so Streamlit
+            # pushes a single update instead of one per card
+            st.markdown(
+                "".join(
+                    _PERSPECTIVE_TEMPLATE.format(
+                        cls=_perspective_class(perspective['name']),
+                        name=perspective['name'],
+                        justification=perspective['justification']
+                    )
+                    for perspective in headline_data['perspectives']
+                ),
+                unsafe_allow_html=True
+            )
+
             for perspective in headline_data['perspectives']:
-                # Determine perspective class for styling
-                perspective_class = ""
-                if 'left' in perspective['name'].lower():
-                    perspective_class = "left-perspective"
-                elif 'right' in perspective['name'].lower():
-                    perspective_class = "right-perspective"
-                elif 'center' in perspective['name'].lower():
-                    perspective_class = "center-perspective"
-                
-                st.markdown(f"""
-                <div class="perspective-card {perspective_class}">
-                    <h4>🎯 {perspective['name']}</h4>
-                    <p><strong>Justification:</strong> {perspective['justification']}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
                 if perspective.get('flaws'):
                     with st.expander(f"⚠️ Potential Flaws in {perspective['name']} Perspective"):
                         st.write(perspective['flaws'])
-        
+
         st.divider()
 
 def main():
@@ -139,6 +174,11 @@ def main():
         
         # Force regenerate option
         force_regenerate = st.checkbox("Force Regenerate Report", value=False)
+
+        # Clear the per-article cache (content + research)
+        if st.button("🧹 Clear Article Cache"):
+            article_cache.clear()
+            st.success("Article cache cleared")
         
         # Generate button
         if st.button("🚀 Generate Today's Top 10 Headlines", type="primary"):
@@ -147,13 +187,20 @@ def main():
     # Main content area
     today_str = selected_date.strftime("%Y-%m-%d")
     
-    # Check if we should generate or load from cache
+    # Load the report once per rerun; generation below replaces it in-memory
+    # so the freshly written file is not immediately re-read and re-parsed
+    report_data = load_cached_report(today_str)
+
+    # The post-generation rerun must not retrigger a forced run: with the
+    # checkbox still checked, generate→rerun→generate would loop forever
+    just_generated = st.session_state.pop('just_generated', False)
+
     should_generate = (
-        st.session_state.get('generate_clicked', False) or 
-        force_regenerate or 
-        not load_cached_report(today_str)
+        st.session_state.get('generate_clicked', False) or
+        (force_regenerate and not just_generated) or
+        report_data is None
     )
-    
+
     if should_generate:
         # Show loading state
         with st.spinner("🤖 AI agents are analyzing today's headlines..."):
@@ -163,41 +210,36 @@ def main():
             try:
                 # Initialize pipeline
                 pipeline = SimpleNewsAnalysisPipeline()
-                
-                # Generate report with progress updates
-                status_text.text("🔍 Finding top headlines...")
-                progress_bar.progress(10)
-                
-                status_text.text("📰 Gathering articles from multiple sources...")
-                progress_bar.progress(30)
-                
-                status_text.text("🧠 Analyzing perspectives and compiling research...")
-                progress_bar.progress(60)
-                
-                status_text.text("✍️ Generating final report...")
-                progress_bar.progress(90)
-                
-                # Generate the report
-                report_data = pipeline.generate_daily_report()
-                
-                # Save to cache
-                save_report(today_str, report_data)
-                
-                progress_bar.progress(100)
-                status_text.text("✅ Report generated successfully!")
-                time.sleep(1)
-                
-                # Clear the generate flag
-                st.session_state.generate_clicked = False
-                
+
+                # Render each headline card the moment its analysis finishes,
+                # so the first result appears in seconds instead of the whole
+                # report blocking on the slowest headline
+                results_container = st.container()
+                rendered = 0
+                for event in pipeline.generate_daily_report_stream(force=force_regenerate):
+                    status_text.text(event["stage"])
+                    progress_bar.progress(event.get("progress", 0))
+                    if event.get("headline"):
+                        with results_container:
+                            display_headline(event["headline"], rendered)
+                        rendered += 1
+                    report_data = event.get("report", report_data)
+
             except Exception as e:
                 st.error(f"❌ Error generating report: {str(e)}")
                 st.exception(e)
                 return
-    
-    # Load and display the report
-    report_data = load_cached_report(today_str)
-    
+
+        # Save and rerun outside the try block: st.rerun() works by raising
+        # a control-flow exception that the handler above would swallow
+        save_report(today_str, report_data)
+
+        # Clear the generate flag and rerun so the report renders in
+        # its final order instead of completion order
+        st.session_state.generate_clicked = False
+        st.session_state.just_generated = True
+        st.rerun()
+
     if report_data:
         # Display report metadata
         st.info(f"📅 Report for {selected_date.strftime('%B %d, %Y')} | Generated at {report_data.get('generated_at', 'Unknown time')}")
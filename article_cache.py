@@ -0,0 +1,97 @@
+"""Per-article on-disk cache backed by SQLite.
+
+Stores extracted content and compiled research keyed by normalized URL so
+repeated analysis of the same article skips HTTP fetches and LLM calls.
+Entries expire after Config.CACHE_DURATION_HOURS.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from config import Config
+
+_DB_PATH = os.path.join("workspace", "article_cache.sqlite")
+_TTL_SECONDS = Config.CACHE_DURATION_HOURS * 3600
+
+
+def _connect():
+    """Open the cache database, creating it if needed"""
+    os.makedirs(os.path.dirname(_DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS articles "
+        "(key TEXT PRIMARY KEY, url TEXT, data TEXT, ts REAL)"
+    )
+    return conn
+
+
+# Volatile parameters that vary per share/click without changing the article
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "igshid", "mc_cid", "mc_eid"})
+
+
+def _key(url):
+    """Cache key from the normalized URL (fragment and tracking params stripped)
+
+    The query string stays in the key — CMS URLs commonly address articles
+    via ?id=... — but utm_*/click-id parameters are dropped so different
+    shares of the same article still hit.
+    """
+    parts = urlsplit(url)
+    query = urlencode([
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.startswith("utm_") and name not in _TRACKING_PARAMS
+    ])
+    normalized = f"{parts.scheme}://{parts.netloc.lower()}{parts.path}"
+    if query:
+        normalized += f"?{query}"
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def get_fields(url):
+    """Return the cached fields for a URL, or an empty dict on miss/expiry"""
+    if not url:
+        return {}
+
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                "SELECT data, ts FROM articles WHERE key = ?", (_key(url),)
+            ).fetchone()
+
+        if row and time.time() - row[1] < _TTL_SECONDS:
+            return json.loads(row[0])
+    except Exception as e:
+        print(f"Error reading article cache: {e}")
+
+    return {}
+
+
+def update_fields(url, **fields):
+    """Merge fields into the cached entry for a URL"""
+    if not url:
+        return
+
+    try:
+        data = get_fields(url)
+        data.update(fields)
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO articles (key, url, data, ts) VALUES (?, ?, ?, ?)",
+                (_key(url), url, json.dumps(data), time.time())
+            )
+    except Exception as e:
+        print(f"Error writing article cache: {e}")
+
+
+def clear():
+    """Drop all cached articles"""
+    try:
+        with _connect() as conn:
+            conn.execute("DELETE FROM articles")
+    except Exception as e:
+        print(f"Error clearing article cache: {e}")
@@ -7,6 +7,15 @@ class Config:
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
+    OPENAI_MODEL_MINI = os.getenv("OPENAI_MODEL_MINI", "gpt-4o-mini")
+
+    # Agents that don't need frontier-model reasoning are routed to the
+    # cheaper, lower-latency model; everything else uses OPENAI_MODEL
+    AGENT_MODEL_OVERRIDES = {
+        "HeadlineFinderAgent": OPENAI_MODEL_MINI,
+        "FlawsAgent": OPENAI_MODEL_MINI,
+        "BirdsEyeAgent": OPENAI_MODEL_MINI
+    }
     
     # News API Configuration (optional, for enhanced article fetching)
     NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
@@ -56,7 +65,10 @@ class Config:
         ],
         "temperature": 0.1,
         "max_tokens": 4000,
-        "timeout": 120
+        "timeout": 120,
+        # Fixed seed enables autogen's built-in result caching, so identical
+        # (system message, user message) pairs are answered from disk
+        "cache_seed": 42
     }
     
     # Streamlit Configuration
@@ -87,10 +99,27 @@ class Config:
         
         return status
     
+    # Cached LLM config shared by all agents (built once on first use)
+    _llm_config_cache = None
+
     @classmethod
     def get_llm_config(cls) -> Dict[str, Any]:
-        """Get LLM configuration with validation"""
-        if not cls.OPENAI_API_KEY:
-            raise ValueError("OpenAI API key not configured. Please set OPENAI_API_KEY environment variable.")
-        
-        return cls.LLM_CONFIG.copy() 
\ No newline at end of file
+        """Get LLM configuration with validation (validated and built once)"""
+        if cls._llm_config_cache is None:
+            if not cls.OPENAI_API_KEY:
+                raise ValueError("OpenAI API key not configured. Please set OPENAI_API_KEY environment variable.")
+            cls._llm_config_cache = cls.LLM_CONFIG.copy()
+
+        return cls._llm_config_cache
+
+    @classmethod
+    def get_llm_config_for_agent(cls, agent_name: str) -> Dict[str, Any]:
+        """Get the LLM configuration for one agent, applying model overrides"""
+        config = cls.get_llm_config()
+        model = cls.AGENT_MODEL_OVERRIDES.get(agent_name)
+        if not model:
+            return config
+
+        config = dict(config)
+        config["config_list"] = [{**config["config_list"][0], "model": model}]
+        return config
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""Disk-backed cache for LLM chat responses, backed by SQLite.
+
+Keyed by a hash of (messages, model, temperature) so repeated headlines —
+common across daily runs — are answered from disk instead of the API.
+Entries expire after Config.CACHE_DURATION_HOURS so daily news stays fresh.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from config import Config
+
+_DB_PATH = os.path.join("workspace", "llm_cache.sqlite")
+_TTL_SECONDS = Config.CACHE_DURATION_HOURS * 3600
+
+
+def _connect():
+    """Open the cache database, creating it if needed"""
+    os.makedirs(os.path.dirname(_DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses "
+        "(key TEXT PRIMARY KEY, response TEXT, ts REAL)"
+    )
+    return conn
+
+
+def make_key(messages, model, temperature):
+    """Cache key from the exact request parameters"""
+    payload = json.dumps(messages, sort_keys=True) + model + str(temperature)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get(key):
+    """Return the cached response text, or None on miss/expiry"""
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                "SELECT response, ts FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row and time.time() - row[1] < _TTL_SECONDS:
+            return row[0]
+    except Exception as e:
+        print(f"Error reading LLM cache: {e}")
+
+    return None
+
+
+def put(key, response):
+    """Store a response under its request key"""
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+    except Exception as e:
+        print(f"Error writing LLM cache: {e}")
+
+
+def clear():
+    """Drop all cached responses"""
+    try:
+        with _connect() as conn:
+            conn.execute("DELETE FROM responses")
+    except Exception as e:
+        print(f"Error clearing LLM cache: {e}")
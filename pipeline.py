@@ -1,45 +1,105 @@
+import asyncio
+import concurrent.futures
 import json
 import os
 from datetime import datetime
 from typing import List, Dict, Any
-from agents import news_agents, data_fetcher
+from agents import news_agents, data_fetcher, dedupe_headlines
+import article_cache
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a prompt payload compactly, using orjson when available
+
+    Compact form only: the model parses indented and compact JSON the
+    same, and every indent space is an input token we pay for.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Stdlib decoder for raw_decode-based extraction from mixed text
+# (orjson has no incremental-decode equivalent)
+_DECODER = json.JSONDecoder()
+
+# Created once at import so pipeline instances skip the mkdir/stat syscalls
+_WORKSPACE_DIR = "workspace"
+os.makedirs(_WORKSPACE_DIR, exist_ok=True)
+
+
 class NewsAnalysisPipeline:
     """Orchestrates the multi-agent workflow for news analysis"""
     
+    # Workers for speculative article-content extraction
+    SPECULATIVE_WORKERS = 20
+
     def __init__(self):
         self.agents = news_agents
         self.data_fetcher = data_fetcher
-        self.workspace_dir = "workspace"
-        os.makedirs(self.workspace_dir, exist_ok=True)
+        self.workspace_dir = _WORKSPACE_DIR
+
+        # Speculative extraction futures keyed by URL, plus title -> URL map
+        self._content_futures = {}
+        self._link_by_title = {}
+
+        # autogen keeps per-(proxy, recipient) chat state that a_initiate_chat
+        # clears and appends to; concurrent shards talking to the same agent
+        # would cross-wire replies, so chats are serialized per recipient
+        self._agent_locks = {}
     
-    def generate_daily_report(self) -> Dict[str, Any]:
-        """Generate the complete daily news report"""
+    def generate_daily_report(self, topic_filter: str = None) -> Dict[str, Any]:
+        """Generate the complete daily news report
+
+        When topic_filter is set, non-matching headlines are dropped before
+        dedup, speculation and any LLM work, so a focused report only pays
+        for the stories it covers.
+        """
         print("🚀 Starting daily news report generation...")
-        
+
         # Step 1: Find top headlines
-        headlines = self._find_top_headlines()
+        headlines = self._find_top_headlines(topic_filter)
         print(f"📰 Found {len(headlines)} headlines")
         
-        # Step 2: Process each headline
-        processed_headlines = []
-        for i, headline in enumerate(headlines):
-            print(f"🔍 Processing headline {i+1}/{len(headlines)}: {headline['title'][:50]}...")
-            
+        # Step 2: Process all headlines, preferring the concurrent async path
+        try:
+            processed_headlines = asyncio.run(self._process_headlines_async(headlines))
+        except Exception as e:
+            print(f"❌ Concurrent processing failed, falling back to sequential batches: {e}")
+            processed_headlines = None
+
+        if processed_headlines is None:
             try:
-                processed_headline = self._process_headline(headline)
-                processed_headlines.append(processed_headline)
+                processed_headlines = self._process_headlines_batch(headlines)
             except Exception as e:
-                print(f"❌ Error processing headline {i+1}: {e}")
-                # Add a fallback entry
-                processed_headlines.append({
-                    "title": headline['title'],
-                    "category": headline.get('category', 'other'),
-                    "neutral_summary": f"Analysis unavailable for: {headline['title']}",
-                    "sources": [],
-                    "perspectives": []
-                })
+                print(f"❌ Batch processing failed, falling back to per-headline: {e}")
+                processed_headlines = None
+
+        if processed_headlines is None:
+            processed_headlines = []
+            for i, headline in enumerate(headlines):
+                print(f"🔍 Processing headline {i+1}/{len(headlines)}: {headline['title'][:50]}...")
+
+                try:
+                    processed_headline = self._process_headline(headline)
+                    processed_headlines.append(processed_headline)
+                except Exception as e:
+                    print(f"❌ Error processing headline {i+1}: {e}")
+                    # Add a fallback entry
+                    processed_headlines.append(self._fallback_report_entry(headline))
         
         # Step 3: Create final report
         report = {
@@ -50,16 +110,288 @@ class NewsAnalysisPipeline:
         
         print("✅ Daily report generation completed!")
         return report
-    
-    def _find_top_headlines(self) -> List[Dict[str, str]]:
+
+    # Maximum headlines per batched agent call, sized so array responses stay
+    # well within the 4000 max_tokens configured for the agents
+    BATCH_SIZE = 5
+
+    # Bound concurrent agent conversations to stay within OpenAI rate limits
+    MAX_CONCURRENT_SHARDS = 5
+
+    async def _process_headlines_async(self, headlines: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Process headline shards concurrently on one event loop"""
+        # Locks bind to the loop they are first acquired on, and every report
+        # runs on a fresh loop via asyncio.run — recreate them per run or the
+        # second report raises 'bound to a different event loop'
+        self._agent_locks = {}
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SHARDS)
+
+        async def bounded(shard):
+            async with semaphore:
+                return await self._process_headline_shard_async(shard)
+
+        shards = [
+            headlines[start:start + self.BATCH_SIZE]
+            for start in range(0, len(headlines), self.BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(bounded(shard) for shard in shards))
+        return [entry for shard_results in results for entry in shard_results]
+
+    def _fallback_report_entry(self, headline: Dict[str, str]) -> Dict[str, Any]:
+        """Build a placeholder entry for a headline that could not be analyzed"""
+        return {
+            "title": headline['title'],
+            "category": headline.get('category', 'other'),
+            "neutral_summary": f"Analysis unavailable for: {headline['title']}",
+            "sources": [],
+            "perspectives": []
+        }
+
+    def _process_headlines_batch(self, headlines: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Process all headlines through each agent stage in batched calls
+
+        LLM latency is dominated by per-request overhead and time-to-first-token
+        rather than output length, so one call per stage over a batch of
+        headlines replaces one call per stage per headline.
+        """
+        processed_headlines = []
+        for start in range(0, len(headlines), self.BATCH_SIZE):
+            shard = headlines[start:start + self.BATCH_SIZE]
+            print(f"🔍 Processing headlines {start + 1}-{start + len(shard)} in one batch...")
+            processed_headlines.extend(self._process_headline_shard(shard))
+
+        return processed_headlines
+
+    # Output format instructions for each batched agent stage
+    RESEARCH_SPEC = 'For each element return {"headline": "...", "research": {"Source Name": {"facts": [...], "opinions": [...]}}}.'
+    DETERMINATION_SPEC = 'For each element return {"headline": "...", "solid_facts": [...], "perspectives": {"left|center|right": {"sources": [...], "justification": "..."}}}.'
+    FLAWS_SPEC = 'For each element return {"headline": "...", "left_perspective": {"flaws": [...], "missing_context": "..."}, "right_perspective": {...}, "center_perspective": {...}}.'
+    CONSOLIDATION_SPEC = 'For each element return {"headline": "...", "perspectives": [{"name": "...", "justification": "...", "flaws": [...], "position": "left|center|right"}]}.'
+    REPORT_SPEC = 'For each element return {"headline": "...", "title": "Factual Headline", "category": "world|politics|other", "sources": [{"source": "...", "title": "...", "url": "..."}], "neutral_summary": "...", "perspectives": [{"name": "...", "justification": "...", "flaws": [...]}]}.'
+
+    def _build_bundles(self, headlines: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Build the per-headline article bundle (data fetching only, no LLM)"""
+        bundles = []
+        for headline in headlines:
+            bundles.append({
+                "headline": headline['title'],
+                "category": headline.get('category', 'other'),
+                "articles": self.data_fetcher.fetch_articles_for_headline(headline['title']),
+                "context": self._speculative_content_for(headline['title'])
+            })
+
+        return bundles
+
+    async def _build_bundles_async(self, headlines: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Async twin of _build_bundles: all feeds download concurrently via aiohttp"""
+        articles_per_headline, contexts = await asyncio.gather(
+            asyncio.gather(
+                *(self.data_fetcher.afetch_articles_for_headline(h['title']) for h in headlines)
+            ),
+            asyncio.gather(
+                *(self._aspeculative_content_for(h['title']) for h in headlines)
+            )
+        )
+        return [
+            {
+                "headline": headline['title'],
+                "category": headline.get('category', 'other'),
+                "articles": articles,
+                "context": context
+            }
+            for headline, articles, context in zip(headlines, articles_per_headline, contexts)
+        ]
+
+    def _consolidation_payload(self, bundles, determination_by_headline, flaws_by_headline) -> str:
+        """Serialize the BirdsEye input for a shard"""
+        analysis = [
+            {
+                "headline": bundle['headline'],
+                "determination": determination_by_headline.get(bundle['headline'], {}),
+                "flaws": flaws_by_headline.get(bundle['headline'], {})
+            }
+            for bundle in bundles
+        ]
+        return _json_dumps(analysis)
+
+    def _report_payload(self, bundles, research_by_headline, consolidated) -> str:
+        """Serialize the Journalist input for a shard"""
+        report_input = [
+            {
+                "headline": bundle['headline'],
+                "category": bundle['category'],
+                "articles": bundle['articles'],
+                "research": research_by_headline.get(bundle['headline'], {}),
+                "perspectives": consolidated.get(bundle['headline'], {}).get('perspectives', [])
+            }
+            for bundle in bundles
+        ]
+        return _json_dumps(report_input)
+
+    def _assemble_shard_results(self, headlines, final_reports) -> List[Dict[str, Any]]:
+        """Order final reports by headline, falling back per missing headline"""
+        results = []
+        for headline in headlines:
+            report = final_reports.get(headline['title'])
+            if report:
+                report.pop('headline', None)
+                results.append(report)
+            else:
+                results.append(self._fallback_report_entry(headline))
+
+        return results
+
+    def _process_headline_shard(self, headlines: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Run one shard of headlines through the batched agent stages"""
+        bundles = self._build_bundles(headlines)
+        bundles_text = _json_dumps(bundles)
+
+        # The three analysis stages are independent, so batch-call them in parallel
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            research_future = executor.submit(
+                self._batch_stage, self.agents.research_compiler, bundles_text, self.RESEARCH_SPEC
+            )
+            determination_future = executor.submit(
+                self._batch_stage, self.agents.determinator, bundles_text, self.DETERMINATION_SPEC
+            )
+            flaws_future = executor.submit(
+                self._batch_stage, self.agents.flaws_agent, bundles_text, self.FLAWS_SPEC
+            )
+
+            research_by_headline = self._index_by_headline(research_future.result())
+            determination_by_headline = self._index_by_headline(determination_future.result())
+            flaws_by_headline = self._index_by_headline(flaws_future.result())
+
+        # Consolidate perspectives for the whole shard in one BirdsEye call
+        consolidated = self._index_by_headline(
+            self._batch_stage(
+                self.agents.birds_eye,
+                self._consolidation_payload(bundles, determination_by_headline, flaws_by_headline),
+                self.CONSOLIDATION_SPEC
+            )
+        )
+
+        # Generate all final reports in one Journalist call
+        final_reports = self._index_by_headline(
+            self._batch_stage(
+                self.agents.journalist,
+                self._report_payload(bundles, research_by_headline, consolidated),
+                self.REPORT_SPEC
+            )
+        )
+
+        return self._assemble_shard_results(headlines, final_reports)
+
+    async def _process_headline_shard_async(self, headlines: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Async twin of _process_headline_shard using autogen's a_initiate_chat"""
+        bundles = await self._build_bundles_async(headlines)
+        bundles_text = _json_dumps(bundles)
+
+        research, determination, flaws = await asyncio.gather(
+            self._batch_stage_async(self.agents.research_compiler, bundles_text, self.RESEARCH_SPEC),
+            self._batch_stage_async(self.agents.determinator, bundles_text, self.DETERMINATION_SPEC),
+            self._batch_stage_async(self.agents.flaws_agent, bundles_text, self.FLAWS_SPEC)
+        )
+        research_by_headline = self._index_by_headline(research)
+        determination_by_headline = self._index_by_headline(determination)
+        flaws_by_headline = self._index_by_headline(flaws)
+
+        consolidated = self._index_by_headline(
+            await self._batch_stage_async(
+                self.agents.birds_eye,
+                self._consolidation_payload(bundles, determination_by_headline, flaws_by_headline),
+                self.CONSOLIDATION_SPEC
+            )
+        )
+
+        final_reports = self._index_by_headline(
+            await self._batch_stage_async(
+                self.agents.journalist,
+                self._report_payload(bundles, research_by_headline, consolidated),
+                self.REPORT_SPEC
+            )
+        )
+
+        return self._assemble_shard_results(headlines, final_reports)
+
+    def _stage_message(self, payload_text: str, output_spec: str) -> str:
+        """Build the user message for one batched agent stage"""
+        return f"""You will receive a JSON array of items. Process every element and return a parallel JSON array of the same length, in the same order. {output_spec}
+
+{payload_text}"""
+
+    def _batch_stage(self, agent, payload_text: str, output_spec: str) -> List[Dict[str, Any]]:
+        """Run one agent over a JSON array payload and parse the array response"""
+        chat_result = self.agents.user_proxy.initiate_chat(
+            agent,
+            message=self._stage_message(payload_text, output_spec),
+            max_turns=3
+        )
+
+        response_text = chat_result.chat_history[-1]["content"]
+        response = self._extract_json_from_response(response_text)
+        return response if isinstance(response, list) else []
+
+    def _agent_lock(self, agent) -> asyncio.Lock:
+        """Lock serializing conversations with one agent instance"""
+        lock = self._agent_locks.get(agent.name)
+        if lock is None:
+            lock = self._agent_locks.setdefault(agent.name, asyncio.Lock())
+        return lock
+
+    async def _batch_stage_async(self, agent, payload_text: str, output_spec: str) -> List[Dict[str, Any]]:
+        """Async variant of _batch_stage
+
+        The per-agent lock keeps a shard's conversation with a recipient
+        intact while other shards wait their turn for that same agent; the
+        three analysis agents stay independent, so shard stages still overlap.
+        """
+        async with self._agent_lock(agent):
+            chat_result = await self.agents.user_proxy.a_initiate_chat(
+                agent,
+                message=self._stage_message(payload_text, output_spec),
+                max_turns=3
+            )
+            # Read the reply before releasing: the next shard's chat with
+            # this agent clears the shared history the result points into
+            response_text = chat_result.chat_history[-1]["content"]
+
+        response = self._extract_json_from_response(response_text)
+        return response if isinstance(response, list) else []
+
+    def _index_by_headline(self, items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Index a batched stage response by its headline field"""
+        indexed = {}
+        for item in items:
+            if isinstance(item, dict) and item.get('headline'):
+                indexed[item['headline']] = item
+        return indexed
+
+    def _find_top_headlines(self, topic_filter: str = None) -> List[Dict[str, str]]:
         """Find top 10 headlines using the HeadlineFinderAgent"""
         try:
             # First, fetch actual headlines from RSS
             raw_headlines = self.data_fetcher.fetch_google_news_rss("top")
-            
+
+            # Apply the topic filter before dedup and speculative fetching so
+            # downstream cost scales with the matching subset, not the feed
+            if topic_filter:
+                needle = topic_filter.lower()
+                raw_headlines = [h for h in raw_headlines if needle in h.get('title', '').lower()]
+
+            # Collapse near-duplicate stories before any LLM work
+            raw_headlines = dedupe_headlines(raw_headlines)
+
             if not raw_headlines:
                 # Fallback to simulated headlines if RSS fails
                 raw_headlines = self._get_fallback_headlines()
+
+            # Speculatively start extracting every candidate's content while
+            # the headline finder decides which ones make the top 10 — the
+            # HTTP latency overlaps the LLM round-trip and losing candidates
+            # are simply discarded
+            self._speculate_content(raw_headlines)
             
             # Use the agent to categorize and filter headlines
             headlines_text = "\n".join([f"- {h['title']}" for h in raw_headlines[:15]])
@@ -67,12 +399,11 @@ class NewsAnalysisPipeline:
             # Create a chat with the headline finder agent
             chat_result = self.agents.user_proxy.initiate_chat(
                 self.agents.headline_finder,
-                message=f"""Please analyze these headlines and return the top 10 most significant ones, categorized as 'world', 'politics', or 'other':
+                message=f"""Please analyze these headlines and return the top 10 most significant ones, categorized as 'world', 'politics', or 'other'. Focus on world and political issues. Return only valid JSON in this format:
+[{{"title": "Headline text", "category": "world|politics|other"}}]
 
-{headlines_text}
-
-Focus on world and political issues. Return only valid JSON in this format:
-[{{"title": "Headline text", "category": "world|politics|other"}}]""",
+Headlines:
+{headlines_text}""",
                 max_turns=3
             )
             
@@ -80,21 +411,55 @@ Focus on world and political issues. Return only valid JSON in this format:
             response_text = chat_result.chat_history[-1]["content"]
             headlines = self._extract_json_from_response(response_text)
             
-            # Ensure we have exactly 10 headlines
-            if len(headlines) > 10:
-                headlines = headlines[:10]
-            elif len(headlines) < 10:
-                # Pad with fallback headlines
-                fallback_headlines = self._get_fallback_headlines()
-                while len(headlines) < 10 and fallback_headlines:
-                    headlines.append(fallback_headlines.pop(0))
-            
-            return headlines
+            # Ensure we have exactly 10 headlines, padding with fallbacks
+            needed = 10 - len(headlines)
+            if needed > 0:
+                headlines.extend(self._get_fallback_headlines()[:needed])
+
+            return headlines[:10]
             
         except Exception as e:
             print(f"Error in headline finding: {e}")
             return self._get_fallback_headlines()[:10]
     
+    def _speculate_content(self, raw_headlines: List[Dict[str, str]]) -> None:
+        """Kick off content extraction for every candidate headline"""
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.SPECULATIVE_WORKERS)
+        for headline in raw_headlines:
+            link = headline.get('link')
+            if link and link not in self._content_futures:
+                self._link_by_title[headline['title']] = link
+                self._content_futures[link] = executor.submit(
+                    self.data_fetcher.extract_article_content, link
+                )
+        executor.shutdown(wait=False)
+
+    def _speculative_content_for(self, title: str) -> str:
+        """Return speculatively extracted content for a chosen headline, if ready"""
+        future = self._content_futures.get(self._link_by_title.get(title))
+        if not future:
+            return ""
+
+        try:
+            return future.result(timeout=2)
+        except Exception:
+            return ""
+
+    async def _aspeculative_content_for(self, title: str) -> str:
+        """Async twin of _speculative_content_for
+
+        Awaits the extraction future instead of blocking the event loop on
+        Future.result, so slow extractions never stall other shards' work.
+        """
+        future = self._content_futures.get(self._link_by_title.get(title))
+        if not future:
+            return ""
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=2)
+        except Exception:
+            return ""
+
     def _process_headline(self, headline: Dict[str, str]) -> Dict[str, Any]:
         """Process a single headline through the entire pipeline"""
         headline_title = headline['title']
@@ -102,14 +467,13 @@ Focus on world and political issues. Return only valid JSON in this format:
         
         # Step 1: Find articles for this headline
         articles = self._find_articles_for_headline(headline_title)
-        
-        # Step 2: Compile research from articles
-        research_data = self._compile_research(articles)
-        
-        # Step 3: Determine perspectives and facts
+
+        # Step 2: Run the independent analysis stages on the article bundle
         if category in ['world', 'politics']:
-            perspectives_data = self._analyze_perspectives(research_data, articles)
+            research_data, determination_data, flaws_data = self._run_analysis_stages(articles)
+            perspectives_data = self._consolidate_perspectives(determination_data, flaws_data)
         else:
+            research_data = self._compile_research(articles)
             perspectives_data = {"perspectives": []}
         
         # Step 4: Generate final report
@@ -125,22 +489,23 @@ Focus on world and political issues. Return only valid JSON in this format:
     
     def _find_articles_for_headline(self, headline: str) -> List[Dict[str, str]]:
         """Find articles from different sources for a headline"""
+        # Fetch outside the try so the error path below can return the
+        # already-retrieved list instead of repeating the network round trip
+        articles = self.data_fetcher.fetch_articles_for_headline(headline)
+
         try:
-            # Use the data fetcher to get articles
-            articles = self.data_fetcher.fetch_articles_for_headline(headline)
-            
             # Use the article finder agent to enhance the results
             articles_text = "\n".join([f"- {a['source']}: {a['title']}" for a in articles])
             
             chat_result = self.agents.user_proxy.initiate_chat(
                 self.agents.article_finder,
-                message=f"""For this headline: "{headline}"
+                message=f"""Please analyze the articles found for a headline and return a JSON list of the most relevant ones with their sources and perspectives:
+[{{"source": "Source Name", "title": "Article Title", "url": "URL", "perspective": "left|center|right"}}]
 
-I have found these articles:
-{articles_text}
+Headline: "{headline}"
 
-Please analyze and return a JSON list of the most relevant articles with their sources and perspectives:
-[{{"source": "Source Name", "title": "Article Title", "url": "URL", "perspective": "left|center|right"}}]""",
+Articles found:
+{articles_text}""",
                 max_turns=2
             )
             
@@ -154,59 +519,98 @@ Please analyze and return a JSON list of the most relevant articles with their s
             
         except Exception as e:
             print(f"Error finding articles: {e}")
-            return self.data_fetcher.fetch_articles_for_headline(headline)
+            return articles
     
+    def _articles_payload(self, articles: List[Dict[str, str]]) -> str:
+        """Serialize the article bundle for the analysis agents in one pass"""
+        return _json_dumps([
+            {
+                "source": article['source'],
+                "title": article['title'],
+                "content": article.get('content', ''),
+                "perspective": article.get('perspective', 'unknown')
+            }
+            for article in articles
+        ])
+
+    def _run_analysis_stages(self, articles: List[Dict[str, str]]) -> tuple:
+        """Run research compilation, truth determination and flaw analysis in parallel
+
+        The three stages all consume the same article bundle and have no data
+        dependency on each other, so their LLM round-trips can overlap. The
+        bundle is serialized once here rather than per stage.
+        """
+        articles_text = self._articles_payload(articles)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            research_future = executor.submit(self._compile_research, articles)
+            determination_future = executor.submit(self._determine_truths, articles, articles_text)
+            flaws_future = executor.submit(self._identify_flaws, articles, articles_text)
+
+            return (
+                research_future.result(),
+                determination_future.result(),
+                flaws_future.result()
+            )
+
     def _compile_research(self, articles: List[Dict[str, str]]) -> Dict[str, Any]:
-        """Compile research from all articles"""
+        """Compile research from all articles, reusing per-article cached results"""
         try:
-            # Prepare article data for the research compiler
-            articles_data = []
+            # Only send articles without cached research to the LLM
+            research_data = {}
+            uncached_articles = []
             for article in articles:
-                articles_data.append({
-                    "source": article['source'],
-                    "title": article['title'],
-                    "content": article.get('content', ''),
-                    "perspective": article.get('perspective', 'unknown')
-                })
-            
-            articles_text = json.dumps(articles_data, indent=2)
-            
-            chat_result = self.agents.user_proxy.initiate_chat(
-                self.agents.research_compiler,
-                message=f"""Please analyze these articles and extract facts and opinions:
+                cached = article_cache.get_fields(article.get('url', ''))
+                if cached.get('research'):
+                    research_data[article['source']] = cached['research']
+                else:
+                    uncached_articles.append(article)
+
+            if not uncached_articles:
+                return research_data
 
-{articles_text}
+            articles_text = self._articles_payload(uncached_articles)
 
-Return the analysis in JSON format:
+            chat_result = self.agents.user_proxy.initiate_chat(
+                self.agents.research_compiler,
+                message=f"""Please analyze the following articles and extract facts and opinions. Return the analysis in JSON format:
 {{
   "Source Name": {{"facts": ["fact1", "fact2"], "opinions": ["opinion1", "opinion2"]}},
   ...
-}}""",
+}}
+
+Articles:
+{articles_text}""",
                 max_turns=3
             )
             
             response_text = chat_result.chat_history[-1]["content"]
-            research_data = self._extract_json_from_response(response_text)
-            
+            fresh_research = self._extract_json_from_response(response_text)
+
+            if isinstance(fresh_research, dict):
+                research_data.update(fresh_research)
+
+                # Cache each article's research for future runs
+                for article in uncached_articles:
+                    research = fresh_research.get(article['source'])
+                    if research:
+                        article_cache.update_fields(article.get('url', ''), research=research)
+
             return research_data
-            
+
         except Exception as e:
             print(f"Error compiling research: {e}")
             return {}
     
-    def _analyze_perspectives(self, research_data: Dict[str, Any], articles: List[Dict[str, str]]) -> Dict[str, Any]:
-        """Analyze perspectives and identify flaws"""
+    def _determine_truths(self, articles: List[Dict[str, str]],
+                          articles_text: str = None) -> Dict[str, Any]:
+        """Determine solid facts and map perspectives from the articles"""
         try:
-            # Step 1: Determine solid facts and perspectives
-            research_text = json.dumps(research_data, indent=2)
-            
+            if articles_text is None:
+                articles_text = self._articles_payload(articles)
+
             chat_result = self.agents.user_proxy.initiate_chat(
                 self.agents.determinator,
-                message=f"""Based on this research data:
-
-{research_text}
-
-Please identify solid facts and map perspectives. Return in JSON format:
+                message=f"""Please identify solid facts and map perspectives from the following articles. Return in JSON format:
 {{
   "solid_facts": ["fact1", "fact2"],
   "perspectives": {{
@@ -214,49 +618,61 @@ Please identify solid facts and map perspectives. Return in JSON format:
     "right": {{"sources": ["source2"], "justification": "..."}},
     "center": {{"sources": ["source3"], "justification": "..."}}
   }}
-}}""",
+}}
+
+Articles:
+{articles_text}""",
                 max_turns=3
             )
-            
+
             response_text = chat_result.chat_history[-1]["content"]
-            determination_data = self._extract_json_from_response(response_text)
-            
-            # Step 2: Identify flaws in each perspective
-            determination_text = json.dumps(determination_data, indent=2)
-            
-            chat_result = self.agents.user_proxy.initiate_chat(
-                self.agents.flaws_agent,
-                message=f"""Based on this perspective analysis:
+            return self._extract_json_from_response(response_text)
+
+        except Exception as e:
+            print(f"Error determining truths: {e}")
+            return {}
 
-{determination_text}
+    def _identify_flaws(self, articles: List[Dict[str, str]],
+                        articles_text: str = None) -> Dict[str, Any]:
+        """Identify flaws in each perspective present in the articles"""
+        try:
+            if articles_text is None:
+                articles_text = self._articles_payload(articles)
 
-Please identify potential flaws in each perspective. Return in JSON format:
+            chat_result = self.agents.user_proxy.initiate_chat(
+                self.agents.flaws_agent,
+                message=f"""Please identify potential flaws in each perspective found in the following articles from across the political spectrum. Return in JSON format:
 {{
   "left_perspective": {{"flaws": ["flaw1", "flaw2"], "missing_context": "..."}},
   "right_perspective": {{"flaws": ["flaw1", "flaw2"], "missing_context": "..."}},
   "center_perspective": {{"flaws": ["flaw1", "flaw2"], "missing_context": "..."}}
-}}""",
+}}
+
+Articles:
+{articles_text}""",
                 max_turns=3
             )
-            
+
             response_text = chat_result.chat_history[-1]["content"]
-            flaws_data = self._extract_json_from_response(response_text)
-            
-            # Step 3: Consolidate all perspectives
+            return self._extract_json_from_response(response_text)
+
+        except Exception as e:
+            print(f"Error identifying flaws: {e}")
+            return {}
+
+    def _consolidate_perspectives(self, determination_data: Dict[str, Any], flaws_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Consolidate the parallel analysis results into a comprehensive view"""
+        try:
             all_data = {
                 "determination": determination_data,
                 "flaws": flaws_data
             }
-            
-            all_data_text = json.dumps(all_data, indent=2)
-            
-            chat_result = self.agents.user_proxy.initiate_chat(
-                self.agents.birds_eye,
-                message=f"""Based on this complete analysis:
 
-{all_data_text}
+            all_data_text = _json_dumps(all_data)
 
-Please consolidate all perspectives into a comprehensive view. Return in JSON format:
+            chat_result = self.agents.user_proxy.initiate_chat(
+                self.agents.birds_eye,
+                message=f"""Please consolidate all perspectives from the following analysis into a comprehensive view. Return in JSON format:
 {{
   "perspectives": [
     {{
@@ -266,7 +682,10 @@ Please consolidate all perspectives into a comprehensive view. Return in JSON fo
       "position": "left|center|right"
     }}
   ]
-}}""",
+}}
+
+Analysis:
+{all_data_text}""",
                 max_turns=3
             )
             
@@ -274,9 +693,9 @@ Please consolidate all perspectives into a comprehensive view. Return in JSON fo
             consolidated_data = self._extract_json_from_response(response_text)
             
             return consolidated_data
-            
+
         except Exception as e:
-            print(f"Error analyzing perspectives: {e}")
+            print(f"Error consolidating perspectives: {e}")
             return {"perspectives": []}
     
     def _generate_final_report(self, headline: str, articles: List[Dict[str, str]], 
@@ -293,15 +712,11 @@ Please consolidate all perspectives into a comprehensive view. Return in JSON fo
                 "perspectives": perspectives_data.get("perspectives", [])
             }
             
-            report_text = json.dumps(report_data, indent=2)
+            report_text = _json_dumps(report_data)
             
             chat_result = self.agents.user_proxy.initiate_chat(
                 self.agents.journalist,
-                message=f"""Please create the final news report based on this data:
-
-{report_text}
-
-Return the final report in JSON format:
+                message=f"""Please create the final news report from the data below. Return the final report in JSON format:
 {{
   "title": "Factual Headline",
   "category": "world|politics|other",
@@ -314,7 +729,10 @@ Return the final report in JSON format:
       "flaws": ["..."]
     }}
   ]
-}}""",
+}}
+
+Data:
+{report_text}""",
                 max_turns=3
             )
             
@@ -334,24 +752,20 @@ Return the final report in JSON format:
             }
     
     def _extract_json_from_response(self, response_text: str) -> Any:
-        """Extract JSON from agent response"""
+        """Extract the first JSON value from an agent response
+
+        JSONDecoder.raw_decode locates and parses the value in a single
+        pass starting at the first bracket, consuming exactly one JSON
+        token — so trailing prose after the value no longer breaks
+        extraction the way the old rfind-based slice did.
+        """
         try:
-            # Look for JSON in the response
-            json_start = response_text.find('[')
-            if json_start == -1:
-                json_start = response_text.find('{')
-            
-            if json_start != -1:
-                json_end = response_text.rfind(']') + 1
-                if json_end == 0:
-                    json_end = response_text.rfind('}') + 1
-                
-                json_str = response_text[json_start:json_end]
-                return json.loads(json_str)
-            else:
-                # Try to parse the entire response as JSON
-                return json.loads(response_text)
-                
+            starts = [i for i in (response_text.find('['), response_text.find('{')) if i != -1]
+            if not starts:
+                return _json_loads(response_text)
+
+            return _DECODER.raw_decode(response_text, min(starts))[0]
+
         except Exception as e:
             print(f"Error extracting JSON: {e}")
             print(f"Response text: {response_text[:200]}...")
@@ -0,0 +1,63 @@
+"""Disk-backed cache for processed reports and headline analyses.
+
+Replaces the per-fingerprint JSON files under workspace/ with a single
+SQLite database, so lookups and writes are indexed single-row operations
+with atomic commits instead of directory scans and whole-file rewrites.
+Shorter TTL than the article caches because reports go stale faster.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+_DB_PATH = os.path.join("workspace", "report_cache.sqlite")
+_TTL_SECONDS = 6 * 3600
+
+
+def _connect():
+    """Open the cache database, creating it if needed"""
+    os.makedirs(os.path.dirname(_DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS entries "
+        "(key TEXT PRIMARY KEY, value TEXT, ts REAL)"
+    )
+    return conn
+
+
+def get(key):
+    """Return the cached JSON value, or None on miss/expiry"""
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                "SELECT value, ts FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row and time.time() - row[1] < _TTL_SECONDS:
+            return json.loads(row[0])
+    except Exception as e:
+        print(f"Error reading report cache: {e}")
+
+    return None
+
+
+def put(key, value):
+    """Store a JSON-serializable value under its key"""
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, ts) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time())
+            )
+    except Exception as e:
+        print(f"Error writing report cache: {e}")
+
+
+def clear():
+    """Drop all cached entries"""
+    try:
+        with _connect() as conn:
+            conn.execute("DELETE FROM entries")
+    except Exception as e:
+        print(f"Error clearing report cache: {e}")
@@ -0,0 +1,80 @@
+"""Retry and circuit-breaker helpers for LLM calls.
+
+Transient provider errors (rate limits, timeouts) are retried with
+exponential backoff plus jitter instead of immediately degrading to the
+hard-coded fallbacks. A shared circuit breaker opens after several
+consecutive failures so a provider outage fails fast rather than making
+every call wait out its full timeout.
+"""
+
+import asyncio
+import functools
+import random
+import time
+
+try:
+    from openai import RateLimitError, APITimeoutError, APIConnectionError
+    RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+except ImportError:
+    RETRYABLE_ERRORS = ()
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker short-circuits a call"""
+
+
+class CircuitBreaker:
+    """Opens after N consecutive failures, rejecting calls for a cooldown"""
+
+    def __init__(self, failure_threshold=5, reset_seconds=60):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may proceed (half-open after the cooldown)"""
+        if self._failures < self.failure_threshold:
+            return True
+        return time.time() - self._opened_at >= self.reset_seconds
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.time()
+
+
+# One breaker shared by all LLM call sites in the process
+breaker = CircuitBreaker()
+
+
+def retry_async(max_attempts=4, base_delay=1.0, max_delay=30.0):
+    """Retry an async LLM call on transient provider errors
+
+    Exponential backoff with jitter between attempts; non-retryable errors
+    propagate immediately so callers' fallbacks still apply.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                if not breaker.allow():
+                    raise CircuitOpenError("LLM circuit breaker is open")
+
+                try:
+                    result = await func(*args, **kwargs)
+                    breaker.record_success()
+                    return result
+                except RETRYABLE_ERRORS as e:
+                    breaker.record_failure()
+                    if attempt == max_attempts:
+                        raise
+                    delay = min(max_delay, base_delay * 2 ** (attempt - 1)) * (0.5 + random.random())
+                    print(f"⏳ Transient LLM error ({type(e).__name__}), retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
+
+        return wrapper
+    return decorator
@@ -4,11 +4,17 @@ Diderot AI Startup Script
 Checks configuration and launches the Streamlit application
 """
 
+import hashlib
+import importlib
 import os
 import sys
 import subprocess
 from config import Config
 
+# Fingerprint of the last successfully installed requirements.txt, so
+# --install-deps skips the slow pip resolver run when nothing changed
+DEPS_STAMP_FILE = os.path.join("workspace", ".deps.sha")
+
 def check_configuration():
     """Check if the application is properly configured"""
     print("🔧 Checking configuration...")
@@ -35,12 +41,34 @@ def check_configuration():
     print("✅ Configuration looks good!")
     return True
 
+def _requirements_digest():
+    """Hash of requirements.txt, or None if it can't be read"""
+    try:
+        with open("requirements.txt", "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
 def install_dependencies():
-    """Install required dependencies"""
+    """Install required dependencies, skipping when requirements are unchanged"""
+    digest = _requirements_digest()
+    if digest:
+        try:
+            with open(DEPS_STAMP_FILE) as f:
+                if f.read().strip() == digest:
+                    print("📦 Dependencies unchanged, skipping install")
+                    return True
+        except OSError:
+            pass
+
     print("📦 Installing dependencies...")
-    
+
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        if digest:
+            os.makedirs(os.path.dirname(DEPS_STAMP_FILE), exist_ok=True)
+            with open(DEPS_STAMP_FILE, "w") as f:
+                f.write(digest)
         print("✅ Dependencies installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -48,19 +76,17 @@ def install_dependencies():
         return False
 
 def run_tests():
-    """Run the test suite"""
+    """Run the setup checks in-process (saves a second interpreter startup)"""
     print("🧪 Running tests...")
-    
+
     try:
-        result = subprocess.run([sys.executable, "test_setup.py"], capture_output=True, text=True)
-        if result.returncode == 0:
+        test_setup = importlib.import_module("test_setup")
+        if test_setup.main():
             print("✅ All tests passed!")
             return True
-        else:
-            print("❌ Some tests failed:")
-            print(result.stdout)
-            print(result.stderr)
-            return False
+        # Failure details were already printed by test_setup itself
+        print("❌ Some tests failed")
+        return False
     except Exception as e:
         print(f"❌ Failed to run tests: {e}")
         return False
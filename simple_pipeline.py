@@ -1,104 +1,292 @@
+import asyncio
+import hashlib
 import json
 import os
 from datetime import datetime
 from typing import List, Dict, Any
+import httpx
 import openai
+import llm_cache
+import report_cache
+import resilience
 from config import Config
 
+# Created once at import so per-request pipeline instances (the Streamlit
+# app builds one per generation) skip the repeated mkdir/stat syscalls
+_WORKSPACE_DIR = "workspace"
+os.makedirs(_WORKSPACE_DIR, exist_ok=True)
+
+async def _empty_map() -> Dict[str, Any]:
+    """Awaitable placeholder for a skipped batch stage"""
+    return {}
+
 class SimpleNewsAnalysisPipeline:
     """Simplified pipeline that uses direct OpenAI API calls instead of complex agent interactions"""
-    
-    def __init__(self):
+
+    # Processed results are cached at two levels: the whole report keyed by
+    # the sorted headline set, and each headline individually so runs sharing
+    # only some headlines still reuse those (see report_cache for the TTL)
+
+    def __init__(self, max_concurrent: int = 6):
         self.client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
-        self.workspace_dir = "workspace"
-        os.makedirs(self.workspace_dir, exist_ok=True)
+        # One shared async client with a pool sized for the concurrent
+        # fan-out, so parallel calls reuse warm connections instead of
+        # paying a TLS handshake each (httpx defaults top out at 20)
+        self.async_client = openai.AsyncOpenAI(
+            api_key=Config.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+        )
+        # Headlines are processed concurrently; the semaphore bounds in-flight
+        # requests so we don't trip API rate limits
+        self.max_concurrent = max_concurrent
+        self.workspace_dir = _WORKSPACE_DIR
+        # In-flight requests keyed by cache key: duplicate calls issued
+        # concurrently (near-identical headlines) share one future
+        self._inflight = {}
     
-    def generate_daily_report(self) -> Dict[str, Any]:
+    def generate_daily_report(self, force: bool = False) -> Dict[str, Any]:
         """Generate the complete daily news report using simplified approach"""
+        report = None
+        for event in self.generate_daily_report_stream(force=force):
+            report = event.get("report", report)
+        return report
+
+    def generate_daily_report_stream(self, force: bool = False):
+        """Generate the daily report, yielding progress events as stages finish
+
+        Each event carries a 'stage' description and a 0-100 'progress' value.
+        Completed headline entries are attached under 'headline' as they
+        finish, and the final event carries the full 'report', so the UI can
+        render results incrementally instead of blocking on the whole run.
+        With force=True the report and headline caches are skipped on read
+        (still written), so a forced run rebuilds every analysis.
+        """
         print("🚀 Starting daily news report generation...")
-        
+        yield {"stage": "🔍 Finding top headlines...", "progress": 5}
+
         # Step 1: Generate sample headlines (since RSS might be unreliable)
         headlines = self._generate_sample_headlines()
         print(f"📰 Generated {len(headlines)} headlines")
-        
-        # Step 2: Process each headline
-        processed_headlines = []
-        for i, headline in enumerate(headlines):
-            print(f"🔍 Processing headline {i+1}/{len(headlines)}: {headline['title'][:50]}...")
-            
-            try:
-                processed_headline = self._process_headline_simple(headline)
-                processed_headlines.append(processed_headline)
-            except Exception as e:
-                print(f"❌ Error processing headline {i+1}: {e}")
-                # Add a fallback entry
-                processed_headlines.append({
-                    "title": headline['title'],
-                    "category": headline.get('category', 'other'),
-                    "neutral_summary": f"Analysis unavailable for: {headline['title']}",
-                    "sources": [],
-                    "perspectives": []
-                })
-        
+        yield {"stage": f"📰 Generated {len(headlines)} headlines", "progress": 10}
+
+        # Plan-level cache: an identical headline set within the TTL reuses
+        # the whole processed report without any LLM work
+        plan_key = self._cache_key("report", "\n".join(sorted(h['title'] for h in headlines)))
+        cached_report = None if force else report_cache.get(plan_key)
+        if cached_report is not None:
+            print("📦 Reusing cached report for identical headline set")
+            yield {"stage": "📦 Reusing cached report", "progress": 95}
+            yield {"stage": "✅ Report generated successfully!", "progress": 100, "report": cached_report}
+            return
+
+        # Step 2: Process all headlines concurrently (bounded by max_concurrent),
+        # emitting each one the moment it finishes rather than after the
+        # slowest headline completes
+        processed_headlines = [None] * len(headlines)
+        done = 0
+        loop = asyncio.new_event_loop()
+        try:
+            stream = self._process_headlines_stream(headlines, force=force)
+            while True:
+                try:
+                    i, processed_headline = loop.run_until_complete(stream.__anext__())
+                except StopAsyncIteration:
+                    break
+
+                processed_headlines[i] = processed_headline
+                done += 1
+                yield {
+                    "stage": f"🧠 Analyzed headline {done}/{len(headlines)}",
+                    "progress": 10 + int(85 * done / len(headlines)),
+                    "headline": processed_headline
+                }
+        finally:
+            loop.close()
+
         # Step 3: Create final report
         report = {
             "generated_at": datetime.now().isoformat(),
             "headlines": processed_headlines,
             "total_headlines": len(processed_headlines)
         }
-        
+
+        report_cache.put(plan_key, report)
+
         print("✅ Daily report generation completed!")
-        return report
-    
+        yield {"stage": "✅ Report generated successfully!", "progress": 100, "report": report}
+
+    @staticmethod
+    def _content_key(sources: List[Dict[str, str]]) -> str:
+        """Fingerprint of a source bundle, stable across headline rewordings"""
+        parts = sorted(s.get('url') or s.get('title', '') for s in sources)
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _cache_key(kind: str, name: str) -> str:
+        """Namespaced cache key for a report or headline fingerprint"""
+        return f"{kind}:{hashlib.sha1(name.encode('utf-8')).hexdigest()}"
+
     def _generate_sample_headlines(self) -> List[Dict[str, str]]:
         """Generate sample headlines using OpenAI"""
         try:
             response = self.client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
+                model=Config.OPENAI_MODEL_MINI,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a news headline generator. Generate 10 current, significant headlines that would be in the news today. Focus on world and political issues. Return only valid JSON in this format: [{\"title\": \"Headline text\", \"category\": \"world|politics|other\"}]"
+                        "content": "You are a news headline generator. Generate 10 current, significant headlines that would be in the news today. Focus on world and political issues. Return only valid JSON in this format: {\"headlines\": [{\"title\": \"Headline text\", \"category\": \"world|politics|other\"}]}"
                     }
                 ],
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=1000,
+                response_format={"type": "json_object"},
+                seed=42
             )
-            
+
             content = response.choices[0].message.content
-            headlines = json.loads(content)
+            headlines = json.loads(content).get("headlines", [])
             
-            # Ensure we have exactly 10 headlines
-            if len(headlines) > 10:
-                headlines = headlines[:10]
-            elif len(headlines) < 10:
-                # Pad with fallback headlines
-                fallback_headlines = self._get_fallback_headlines()
-                while len(headlines) < 10 and fallback_headlines:
-                    headlines.append(fallback_headlines.pop(0))
-            
-            return headlines
+            # Ensure we have exactly 10 headlines, padding with fallbacks
+            needed = 10 - len(headlines)
+            if needed > 0:
+                headlines.extend(self._get_fallback_headlines()[:needed])
+
+            return headlines[:10]
             
         except Exception as e:
             print(f"Error generating headlines: {e}")
             return self._get_fallback_headlines()[:10]
     
-    def _process_headline_simple(self, headline: Dict[str, str]) -> Dict[str, Any]:
-        """Process a single headline using simplified approach"""
+    async def _process_headlines_stream(self, headlines: List[Dict[str, str]], force: bool = False):
+        """Yield (index, result) pairs as each headline's analysis finishes
+
+        Headlines run concurrently under a bounded semaphore and are yielded
+        in completion order via asyncio.as_completed. The sources and
+        perspectives stages share one system prompt across headlines, so each
+        is issued as a single batched call covering every headline; failures
+        fall back to the per-headline calls. force=True skips every cache
+        read so all headlines are reprocessed.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        # Per-headline cache check first, so runs sharing only some headlines
+        # skip both the batched stages and the per-headline work for those
+        cached_results = {}
+        uncached = []
+        for headline in headlines:
+            cached = None if force else report_cache.get(self._cache_key("headline", headline['title']))
+            if cached is not None:
+                print(f"📦 Reusing cached analysis for: {headline['title'][:50]}...")
+                cached_results[headline['title']] = cached
+            else:
+                uncached.append(headline)
+
+        sources_map = await self._generate_sources_batch([h['title'] for h in uncached]) if uncached else {}
+
+        # Only batch downstream stages for headlines whose sources came back;
+        # the rest fall through to the per-headline path with fresh sources
+        with_sources = {
+            h['title']: sources_map[h['title']]
+            for h in uncached
+            if h['title'] in sources_map
+        }
+        political = {
+            h['title']: with_sources[h['title']]
+            for h in uncached
+            if h.get('category', 'other') in ['world', 'politics'] and h['title'] in with_sources
+        }
+
+        # One call each for perspectives and summaries, issued concurrently
+        perspectives_map, summaries_map = await asyncio.gather(
+            self._generate_perspectives_batch(political) if political else _empty_map(),
+            self._generate_summaries_batch(with_sources) if with_sources else _empty_map()
+        )
+
+        async def bounded(i: int, headline: Dict[str, str]) -> tuple:
+            async with semaphore:
+                # report_cache hits SQLite; run it in the executor so cache
+                # I/O never stalls the other in-flight headline tasks
+                loop = asyncio.get_running_loop()
+
+                cached = cached_results.get(headline['title'])
+                if cached is not None:
+                    return i, cached
+
+                headline_key = self._cache_key("headline", headline['title'])
+                sources = sources_map.get(headline['title'])
+
+                # Content-hash layer: the same story often resurfaces under a
+                # reworded title, but its source bundle is identical — reuse
+                # the analysis and just restamp the current wording
+                content_key = None
+                if sources:
+                    content_key = self._cache_key("headline", self._content_key(sources))
+                    cached = None if force else await loop.run_in_executor(None, report_cache.get, content_key)
+                    if cached is not None:
+                        print(f"📦 Reusing analysis by content hash for: {headline['title'][:50]}...")
+                        result = dict(cached, title=headline['title'],
+                                      category=headline.get('category', cached.get('category', 'other')))
+                        await loop.run_in_executor(None, report_cache.put, headline_key, result)
+                        return i, result
+
+                print(f"🔍 Processing headline {i+1}/{len(headlines)}: {headline['title'][:50]}...")
+                try:
+                    result = await self._process_headline_simple(
+                        headline,
+                        sources=sources,
+                        perspectives=perspectives_map.get(headline['title']),
+                        neutral_summary=summaries_map.get(headline['title'])
+                    )
+                    await loop.run_in_executor(None, report_cache.put, headline_key, result)
+                    if content_key is not None:
+                        await loop.run_in_executor(None, report_cache.put, content_key, result)
+                    return i, result
+                except Exception as e:
+                    print(f"❌ Error processing headline {i+1}: {e}")
+                    # Add a fallback entry
+                    return i, {
+                        "title": headline['title'],
+                        "category": headline.get('category', 'other'),
+                        "neutral_summary": f"Analysis unavailable for: {headline['title']}",
+                        "sources": [],
+                        "perspectives": []
+                    }
+
+        tasks = [asyncio.ensure_future(bounded(i, h)) for i, h in enumerate(headlines)]
+        for future in asyncio.as_completed(tasks):
+            yield await future
+
+    async def _process_headline_simple(self, headline: Dict[str, str],
+                                       sources: List[Dict[str, str]] = None,
+                                       perspectives: List[Dict[str, Any]] = None,
+                                       neutral_summary: str = None) -> Dict[str, Any]:
+        """Process a single headline, filling any stage the batch calls missed"""
         headline_title = headline['title']
         category = headline.get('category', 'other')
-        
+
         # Generate sources
-        sources = self._generate_sources_for_headline(headline_title)
-        
-        # Generate neutral summary
-        neutral_summary = self._generate_neutral_summary(headline_title, sources)
-        
-        # Generate perspectives if political/world
-        perspectives = []
-        if category in ['world', 'politics']:
-            perspectives = self._generate_perspectives(headline_title, sources)
-        
+        if sources is None:
+            sources = await self._generate_sources_for_headline(headline_title)
+
+        # Summary and perspectives both depend only on the sources, so run
+        # them concurrently to take one LLM round trip off the critical path
+        wants_perspectives = category in ['world', 'politics']
+        if wants_perspectives and perspectives is None and neutral_summary is None:
+            neutral_summary, perspectives = await asyncio.gather(
+                self._generate_neutral_summary(headline_title, sources),
+                self._generate_perspectives(headline_title, sources)
+            )
+        else:
+            if neutral_summary is None:
+                neutral_summary = await self._generate_neutral_summary(headline_title, sources)
+            if wants_perspectives and perspectives is None:
+                perspectives = await self._generate_perspectives(headline_title, sources)
+            elif not wants_perspectives:
+                perspectives = []
+
         return {
             "title": headline_title,
             "category": category,
@@ -107,86 +295,244 @@ class SimpleNewsAnalysisPipeline:
             "perspectives": perspectives
         }
     
-    def _generate_sources_for_headline(self, headline: str) -> List[Dict[str, str]]:
-        """Generate simulated sources for a headline"""
+    async def _cached_chat(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int,
+                           model: str = None) -> str:
+        """Run a chat completion, answering repeats from the disk cache"""
+        model = model or Config.OPENAI_MODEL
+        key = llm_cache.make_key(messages, model, temperature)
+
+        # SQLite reads/writes are blocking; run them in the executor so
+        # concurrent headline tasks actually overlap instead of queueing
+        # behind each other's cache I/O
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, llm_cache.get, key)
+        if cached is not None:
+            return cached
+
+        content = await self._coalesced(key, lambda: self._create_completion(messages, model, temperature, max_tokens))
+        await loop.run_in_executor(None, llm_cache.put, key, content)
+        return content
+
+    async def _coalesced(self, key: str, make_call) -> str:
+        """Share one in-flight request among concurrent duplicate calls"""
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await existing
+
+        future = asyncio.ensure_future(make_call())
+        self._inflight[key] = future
         try:
-            response = self.client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
+            return await future
+        finally:
+            self._inflight.pop(key, None)
+
+    @resilience.retry_async()
+    async def _create_completion(self, messages: List[Dict[str, str]], model: str,
+                                 temperature: float, max_tokens: int) -> str:
+        """Issue one JSON-mode completion, retrying transient provider errors
+
+        JSON mode guarantees the response parses, so no bracket-scanning
+        extraction or malformed-output retries are needed. Streaming means
+        the first tokens arrive in ~100ms and transfer overlaps decoding,
+        instead of blocking on the fully buffered response. The fixed seed
+        (matching the agents' cache_seed) nudges identical requests toward
+        byte-identical outputs, which keeps the content-hash caches hot.
+        """
+        response = await self.async_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            seed=42,
+            stream=True
+        )
+
+        parts = []
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+
+        return "".join(parts)
+
+    async def _generate_sources_batch(self, titles: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Generate sources for all headlines in one call, keyed by headline"""
+        try:
+            content = await self._cached_chat(
                 messages=[
                     {
                         "role": "system",
-                        "content": "Generate 3-6 simulated news sources for this headline. Include left, center, and right perspectives. Return only valid JSON in this format: [{\"source\": \"Source Name\", \"title\": \"Article Title\", \"url\": \"https://example.com/article\", \"perspective\": \"left|center|right\"}]"
+                        "content": "For each headline in the user's JSON array, generate 3-6 simulated news sources. Include left, center, and right perspectives. Return only valid JSON: an object mapping each headline (exactly as given) to an array in this format: [{\"source\": \"Source Name\", \"title\": \"Article Title\", \"url\": \"https://example.com/article\", \"perspective\": \"left|center|right\"}]"
                     },
                     {
                         "role": "user",
-                        "content": f"Headline: {headline}"
+                        "content": json.dumps(titles, separators=(",", ":"))
                     }
                 ],
-                temperature=0.5,
-                max_tokens=800
+                temperature=0.0,
+                max_tokens=4000,
+                model=Config.OPENAI_MODEL_MINI
             )
-            
-            content = response.choices[0].message.content
             return json.loads(content)
-            
+
         except Exception as e:
-            print(f"Error generating sources: {e}")
-            return [
-                {"source": "CNN", "title": f"Article about {headline}", "url": "https://cnn.com/article", "perspective": "left"},
-                {"source": "Reuters", "title": f"Article about {headline}", "url": "https://reuters.com/article", "perspective": "center"},
-                {"source": "Fox News", "title": f"Article about {headline}", "url": "https://foxnews.com/article", "perspective": "right"}
-            ]
-    
-    def _generate_neutral_summary(self, headline: str, sources: List[Dict[str, str]]) -> str:
-        """Generate a neutral factual summary"""
+            print(f"Error generating sources batch: {e}")
+            return {}
+
+    async def _generate_perspectives_batch(self, sources_by_title: Dict[str, List[Dict[str, str]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Generate perspectives for all political/world headlines in one call"""
         try:
-            sources_text = "\n".join([f"- {s['source']}: {s['title']}" for s in sources])
-            
-            response = self.client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
+            payload = {
+                title: [f"{s['source']} ({s.get('perspective', 'unknown')}): {s['title']}" for s in sources]
+                for title, sources in sources_by_title.items()
+            }
+            content = await self._cached_chat(
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a neutral news summarizer. Write a factual, objective summary of the headline based on the provided sources. Focus on verifiable facts only. Keep it concise (2-3 sentences)."
+                        "content": "For each headline in the user's JSON object (values are that headline's sources), generate 2-3 different perspectives. Name each perspective based on actual ideological/policy stances. Include justification and potential flaws. Return only valid JSON: an object mapping each headline (exactly as given) to an array in this format: [{\"name\": \"Perspective Name\", \"justification\": \"...\", \"flaws\": [\"flaw1\", \"flaw2\"]}]"
                     },
                     {
                         "role": "user",
-                        "content": f"Headline: {headline}\n\nSources:\n{sources_text}"
+                        "content": json.dumps(payload, separators=(",", ":"))
+                    }
+                ],
+                temperature=0.0,
+                max_tokens=4000
+            )
+            return json.loads(content)
+
+        except Exception as e:
+            print(f"Error generating perspectives batch: {e}")
+            return {}
+
+    async def _generate_summaries_batch(self, sources_by_title: Dict[str, List[Dict[str, str]]]) -> Dict[str, str]:
+        """Generate neutral summaries for all headlines in one call"""
+        try:
+            payload = {
+                title: [f"{s['source']}: {s['title']}" for s in sources]
+                for title, sources in sources_by_title.items()
+            }
+            content = await self._cached_chat(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a neutral news summarizer. For each headline in the user's JSON object (values are that headline's sources), write a factual, objective summary based on the sources. Focus on verifiable facts only. Keep each concise (2-3 sentences). Return only valid JSON: an object mapping each headline (exactly as given) to its summary string."
+                    },
+                    {
+                        "role": "user",
+                        "content": json.dumps(payload, separators=(",", ":"))
                     }
                 ],
                 temperature=0.3,
-                max_tokens=300
+                max_tokens=3000,
+                model=Config.OPENAI_MODEL_MINI
             )
+            return json.loads(content)
+
+        except Exception as e:
+            print(f"Error generating summaries batch: {e}")
+            return {}
+
+    async def _generate_sources_for_headline(self, headline: str) -> List[Dict[str, str]]:
+        """Generate simulated sources for a headline"""
+        try:
+            content = await self._cached_chat(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Generate 3-6 simulated news sources for this headline. Include left, center, and right perspectives. Return only valid JSON in this format: {\"sources\": [{\"source\": \"Source Name\", \"title\": \"Article Title\", \"url\": \"https://example.com/article\", \"perspective\": \"left|center|right\"}]}"
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Headline: {headline}"
+                    }
+                ],
+                temperature=0.0,
+                max_tokens=500,
+                model=Config.OPENAI_MODEL_MINI
+            )
+            return json.loads(content).get("sources", [])
             
-            return response.choices[0].message.content.strip()
+        except Exception as e:
+            print(f"Error generating sources: {e}")
+            return [
+                {"source": "CNN", "title": f"Article about {headline}", "url": "https://cnn.com/article", "perspective": "left"},
+                {"source": "Reuters", "title": f"Article about {headline}", "url": "https://reuters.com/article", "perspective": "center"},
+                {"source": "Fox News", "title": f"Article about {headline}", "url": "https://foxnews.com/article", "perspective": "right"}
+            ]
+    
+    async def _generate_neutral_summary(self, headline: str, sources: List[Dict[str, str]]) -> str:
+        """Generate a neutral factual summary"""
+        try:
+            sources_text = "\n".join([f"- {s['source']}: {s['title']}" for s in sources])
+            messages = [
+                {
+                    "role": "system",
+                    "content": "You are a neutral news summarizer. Write a factual, objective summary of the headline based on the provided sources. Focus on verifiable facts only. Keep it concise (2-3 sentences)."
+                },
+                {
+                    "role": "user",
+                    "content": f"Headline: {headline}\n\nSources:\n{sources_text}"
+                }
+            ]
+
+            key = llm_cache.make_key(messages, Config.OPENAI_MODEL_MINI, 0.3)
+            loop = asyncio.get_running_loop()
+            cached = await loop.run_in_executor(None, llm_cache.get, key)
+            if cached is not None:
+                return cached
+
+            summary = await self._coalesced(key, lambda: self._stream_summary(messages))
+            await loop.run_in_executor(None, llm_cache.put, key, summary)
+            return summary
             
         except Exception as e:
             print(f"Error generating summary: {e}")
             return f"Analysis unavailable for: {headline}"
+
+    @resilience.retry_async()
+    async def _stream_summary(self, messages: List[Dict[str, str]]) -> str:
+        """Stream a summary completion, retrying transient provider errors"""
+        response = await self.async_client.chat.completions.create(
+            model=Config.OPENAI_MODEL_MINI,
+            messages=messages,
+            temperature=0.3,
+            max_tokens=300,
+            seed=42,
+            stream=True
+        )
+
+        # Accumulate streamed tokens so the first bytes arrive immediately
+        parts = []
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+
+        return "".join(parts).strip()
     
-    def _generate_perspectives(self, headline: str, sources: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    async def _generate_perspectives(self, headline: str, sources: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """Generate multi-perspective analysis"""
         try:
             sources_text = "\n".join([f"- {s['source']} ({s['perspective']}): {s['title']}" for s in sources])
-            
-            response = self.client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
+
+            content = await self._cached_chat(
                 messages=[
                     {
                         "role": "system",
-                        "content": "Generate 2-3 different perspectives on this headline. Name each perspective based on actual ideological/policy stances. Include justification and potential flaws. Return only valid JSON in this format: [{\"name\": \"Perspective Name\", \"justification\": \"...\", \"flaws\": [\"flaw1\", \"flaw2\"]}]"
+                        "content": "Generate 2-3 different perspectives on this headline. Name each perspective based on actual ideological/policy stances. Include justification and potential flaws. Return only valid JSON in this format: {\"perspectives\": [{\"name\": \"Perspective Name\", \"justification\": \"...\", \"flaws\": [\"flaw1\", \"flaw2\"]}]}"
                     },
                     {
                         "role": "user",
                         "content": f"Headline: {headline}\n\nSources:\n{sources_text}"
                     }
                 ],
-                temperature=0.6,
-                max_tokens=800
+                temperature=0.0,
+                max_tokens=600
             )
-            
-            content = response.choices[0].message.content
-            return json.loads(content)
+            return json.loads(content).get("perspectives", [])
             
         except Exception as e:
             print(f"Error generating perspectives: {e}")